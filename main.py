@@ -158,7 +158,8 @@ def main():
                 module_name="main",
                 function_name="main",
                 user_action="URL validation",
-                input_data={"url": args.profile_url}
+                input_data={"url": args.profile_url},
+                exc=e
             )
             error_reporter.report_error(error, context)
             logger.error(f"URL validation error: {e}")
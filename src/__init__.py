@@ -22,7 +22,7 @@ try:
     from .url_validator import URLValidator, validate_linkedin_url
     from .browser_manager import WebDriverManager
     from .content_parser import ContentParser, parse_linkedin_profile
-    from .markdown_generator import MarkdownGenerator, generate_markdown_from_posts
+    from .markdown_generator import MarkdownGenerator, generate_markdown_from_posts, generate_markdown_batch
     from .scroll_automator import ScrollAutomator, create_scroll_automator
     
     # Progress tracking
@@ -63,7 +63,7 @@ try:
         "URLValidator", "validate_linkedin_url",
         "WebDriverManager",
         "ContentParser", "parse_linkedin_profile",
-        "MarkdownGenerator", "generate_markdown_from_posts",
+        "MarkdownGenerator", "generate_markdown_from_posts", "generate_markdown_batch",
         "ScrollAutomator", "create_scroll_automator",
         
         # Progress tracking
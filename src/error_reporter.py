@@ -16,14 +16,21 @@ import traceback
 import sys
 import os
 import platform
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, field, asdict
+import struct
+import functools
+import threading
+from typing import Dict, List, Optional, Any, Union, NamedTuple, Tuple, Sequence, Iterator
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from datetime import datetime, timezone
 from pathlib import Path
-import hashlib
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from .exceptions import (
         LinkedInExtractorError, NetworkError, AuthenticationError,
@@ -67,26 +74,86 @@ class ReportFormat(Enum):
     MARKDOWN = "markdown"
 
 
-@dataclass
-class SystemInfo:
-    """System information for diagnostic purposes."""
-    python_version: str = field(default_factory=lambda: sys.version)
-    platform: str = field(default_factory=platform.platform)
-    architecture: str = field(default_factory=lambda: platform.architecture()[0])
-    processor: str = field(default_factory=lambda: platform.processor() or "unknown")
-    memory_mb: Optional[int] = None
-    disk_space_mb: Optional[int] = None
+class _ClassTemplate(NamedTuple):
+    """Precomputed user-facing guidance for one exception class."""
+    message: str
+    actions: Tuple[str, ...]
+    docs: Tuple[str, ...]
+
+
+_EMPTY_TEMPLATE = _ClassTemplate(message="An error occurred", actions=(), docs=())
+
+
+def _read_proc_field(path: str, key: str) -> Optional[str]:
+    """Return the value of the first ``key: value`` line in a /proc file."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                name, sep, value = line.partition(':')
+                if sep and name.strip() == key:
+                    return value.strip()
+    except OSError:
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _system_info_dict() -> Dict[str, Any]:
+    """
+    Collect host information once per process.
     
-    def __post_init__(self):
-        """Collect additional system information."""
+    On Linux the values are read from os.uname(), /proc and statvfs directly;
+    other platforms fall back to the platform module and psutil.
+    """
+    info: Dict[str, Any] = {
+        "python_version": sys.version,
+        "architecture": f"{struct.calcsize('P') * 8}bit",
+        "memory_mb": None,
+        "disk_space_mb": None,
+    }
+    
+    if sys.platform.startswith('linux'):
+        uname = os.uname()
+        info["platform"] = f"{uname.sysname}-{uname.release}-{uname.machine}"
+        info["processor"] = _read_proc_field('/proc/cpuinfo', 'model name') or uname.machine or "unknown"
+        
+        mem_total = _read_proc_field('/proc/meminfo', 'MemTotal')
+        if mem_total:
+            info["memory_mb"] = int(mem_total.split()[0]) // 1024
+        try:
+            disk = os.statvfs('/')
+            info["disk_space_mb"] = (disk.f_frsize * disk.f_blocks) // (1024 * 1024)
+        except OSError:
+            pass
+    else:
+        info["platform"] = platform.platform()
+        info["processor"] = platform.processor() or "unknown"
         try:
             import psutil
-            self.memory_mb = int(psutil.virtual_memory().total / (1024 * 1024))
-            self.disk_space_mb = int(psutil.disk_usage('/').total / (1024 * 1024))
+            info["memory_mb"] = int(psutil.virtual_memory().total / (1024 * 1024))
+            info["disk_space_mb"] = int(psutil.disk_usage('/').total / (1024 * 1024))
         except ImportError:
             # psutil not available, use basic info
             pass
     
+    return info
+
+
+def _host_field(key: str):
+    """Dataclass field defaulting to a cached host information value."""
+    return field(default_factory=lambda: _system_info_dict()[key])
+
+
+@dataclass
+class SystemInfo:
+    """System information for diagnostic purposes."""
+    python_version: str = _host_field("python_version")
+    platform: str = _host_field("platform")
+    architecture: str = _host_field("architecture")
+    processor: str = _host_field("processor")
+    memory_mb: Optional[int] = _host_field("memory_mb")
+    disk_space_mb: Optional[int] = _host_field("disk_space_mb")
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert SystemInfo to dictionary."""
         return {
@@ -112,13 +179,18 @@ class ErrorContext:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is not None:
+                result[f.name] = value
+        return result
 
 
 @dataclass
 class ErrorReport:
     """Comprehensive error report structure."""
-    error_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    error_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     severity: ErrorSeverity = ErrorSeverity.MEDIUM
     error_type: str = ""
@@ -126,16 +198,14 @@ class ErrorReport:
     error_category: Optional[str] = None
     
     # Technical details
-    exception_type: Optional[str] = None
-    exception_message: Optional[str] = None
     stack_trace: Optional[str] = None
     context: Optional[ErrorContext] = None
     system_info: Optional[SystemInfo] = None
     
     # User-facing information
     user_message: str = ""
-    suggested_actions: List[str] = field(default_factory=list)
-    documentation_links: List[str] = field(default_factory=list)
+    suggested_actions: Sequence[str] = ()
+    documentation_links: Sequence[str] = ()
     
     # Diagnostic information
     retry_info: Optional[Dict[str, Any]] = None
@@ -149,25 +219,25 @@ class ErrorReport:
     
     def __post_init__(self):
         """Post-process the error report."""
-        if not self.error_id:
-            self.error_id = str(uuid.uuid4())
-        
         if not self.timestamp:
             self.timestamp = datetime.now(timezone.utc)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         result = {}
-        for key, value in asdict(self).items():
+        for f in fields(self):
+            value = getattr(self, f.name)
             if value is not None:
                 if isinstance(value, datetime):
-                    result[key] = value.isoformat()
+                    result[f.name] = value.isoformat()
                 elif isinstance(value, Enum):
-                    result[key] = value.value
+                    result[f.name] = value.value
                 elif hasattr(value, 'to_dict'):
-                    result[key] = value.to_dict()
+                    result[f.name] = value.to_dict()
+                elif isinstance(value, (list, tuple)):
+                    result[f.name] = list(value)
                 else:
-                    result[key] = value
+                    result[f.name] = value
         return result
     
     def to_json(self, indent: int = 2) -> str:
@@ -202,7 +272,7 @@ class ErrorReporter:
         # Error tracking
         self.error_history: List[ErrorReport] = []
         self.error_counts: Dict[str, int] = {}
-        self.session_id = str(uuid.uuid4())
+        self.session_id = uuid.uuid4().hex
         
         # System information (collected once)
         self.system_info = SystemInfo() if include_system_info else None
@@ -314,12 +384,28 @@ class ErrorReporter:
                 "docs": ["https://github.com/linkedin-extractor/docs/configuration"]
             }
         }
+        
+        # Resolve templates once, keyed by exception class for direct lookup
+        exception_classes = (
+            NetworkError, BrowserError, AuthenticationError, ExtractionError,
+            ValidationError, RateLimitError, ConfigurationError
+        )
+        self._template_by_cls: Dict[type, _ClassTemplate] = {}
+        for exception_class in exception_classes:
+            template = self.error_templates[exception_class.__name__]
+            self._template_by_cls[exception_class] = _ClassTemplate(
+                message=template["message"],
+                actions=tuple(template["actions"]),
+                docs=tuple(template["docs"])
+            )
     
     def create_error_context(self, 
                            module_name: str,
                            function_name: str,
                            user_action: Optional[str] = None,
-                           input_data: Optional[Dict[str, Any]] = None) -> ErrorContext:
+                           input_data: Optional[Dict[str, Any]] = None,
+                           *,
+                           exc: Optional[BaseException] = None) -> ErrorContext:
         """
         Create error context information.
         
@@ -328,12 +414,23 @@ class ErrorReporter:
             function_name: Name of the function where error occurred
             user_action: Description of user action that triggered the error
             input_data: Sanitized input data (remove sensitive information)
+            exc: Raised exception whose innermost traceback frame locates the failure
             
         Returns:
             ErrorContext object
         """
-        # Get caller information from stack trace
-        frame = sys._getframe(1)
+        # Prefer the failure site recorded in the exception's traceback,
+        # falling back to the caller's frame for exceptions never raised
+        if exc is not None and exc.__traceback__ is not None:
+            tb = exc.__traceback__
+            while tb.tb_next is not None:
+                tb = tb.tb_next
+            line_number = tb.tb_lineno
+            file_path = tb.tb_frame.f_code.co_filename
+        else:
+            frame = sys._getframe(1)
+            line_number = frame.f_lineno
+            file_path = frame.f_code.co_filename
         
         # Sanitize input data (remove sensitive information)
         sanitized_input = {}
@@ -349,8 +446,8 @@ class ErrorReporter:
         return ErrorContext(
             module_name=module_name,
             function_name=function_name,
-            line_number=frame.f_lineno,
-            file_path=frame.f_code.co_filename,
+            line_number=line_number,
+            file_path=file_path,
             user_action=user_action,
             input_data=sanitized_input if sanitized_input else None
         )
@@ -384,7 +481,7 @@ class ErrorReporter:
         error_category = get_error_category(exception)
         
         # Get error template
-        template = self.error_templates.get(type(exception).__name__, {})
+        template = self._template_by_cls.get(type(exception), _EMPTY_TEMPLATE)
         
         # Create error report
         report = ErrorReport(
@@ -392,14 +489,14 @@ class ErrorReporter:
             error_type=type(exception).__name__,
             error_message=str(exception),
             error_category=error_category.value if error_category else None,
-            exception_type=type(exception).__name__,
-            exception_message=str(exception),
             stack_trace=traceback.format_exc(),
             context=context,
             system_info=self.system_info,
-            user_message=template.get("message", "An error occurred"),
-            suggested_actions=template.get("actions", []),
-            documentation_links=template.get("docs", []),
+            user_message=template.message,
+            suggested_actions=template.actions,
+            documentation_links=template.docs,
+            # Classified from the exception type now; the report must not keep
+            # the exception (and its traceback frames) alive in error_history
             is_recoverable=is_recoverable_error(exception),
             is_user_error=self._is_user_error(exception),
             requires_immediate_attention=severity in [ErrorSeverity.CRITICAL, ErrorSeverity.HIGH]
@@ -477,9 +574,9 @@ class ErrorReporter:
         error_key = f"{report.error_type}:{report.error_category}"
         self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
         
-        # Limit history size to prevent memory issues
+        # Limit history size to prevent memory issues (trim in place)
         if len(self.error_history) > 1000:
-            self.error_history = self.error_history[-500:]
+            del self.error_history[:-500]
     
     def get_error_summary(self, hours: int = 24) -> Dict[str, Any]:
         """
@@ -551,117 +648,140 @@ class ErrorReporter:
     
     def _generate_text_report(self, include_history: bool, max_errors: int) -> str:
         """Generate text format error report."""
-        lines = []
-        lines.append("LinkedIn Post Extractor - Error Report")
-        lines.append("=" * 50)
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Session ID: {self.session_id}")
-        lines.append("")
+        return "\n".join(self._iter_text_report(include_history, max_errors))
+    
+    def _iter_text_report(self, include_history: bool, max_errors: int) -> Iterator[str]:
+        """Yield text format error report lines."""
+        yield "LinkedIn Post Extractor - Error Report"
+        yield "=" * 50
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield f"Session ID: {self.session_id}"
+        yield ""
         
         # Summary
         summary = self.get_error_summary()
-        lines.append("Error Summary (Last 24 Hours)")
-        lines.append("-" * 30)
-        lines.append(f"Total Errors: {summary['total_errors']}")
-        lines.append(f"Recovery Rate: {summary['recovery_rate']:.1%}")
+        yield "Error Summary (Last 24 Hours)"
+        yield "-" * 30
+        yield f"Total Errors: {summary['total_errors']}"
+        yield f"Recovery Rate: {summary['recovery_rate']:.1%}"
         
         if summary['most_common_error']:
             error_type, count = summary['most_common_error']
-            lines.append(f"Most Common: {error_type} ({count} times)")
+            yield f"Most Common: {error_type} ({count} times)"
         
-        lines.append("")
+        yield ""
         
         # Error distribution
         if summary['error_types']:
-            lines.append("Error Types:")
+            yield "Error Types:"
             for error_type, count in summary['error_types'].items():
-                lines.append(f"  • {error_type}: {count}")
-            lines.append("")
+                yield f"  • {error_type}: {count}"
+            yield ""
         
         # Recent errors
         if include_history and self.error_history:
-            lines.append("Recent Errors")
-            lines.append("-" * 15)
+            yield "Recent Errors"
+            yield "-" * 15
             
             recent_errors = self.error_history[-max_errors:]
             for error in reversed(recent_errors):
-                lines.append(f"[{error.timestamp.strftime('%H:%M:%S')}] {error.severity.value.upper()}: {error.error_type}")
-                lines.append(f"  Message: {error.user_message}")
+                yield f"[{error.timestamp.strftime('%H:%M:%S')}] {error.severity.value.upper()}: {error.error_type}"
+                yield f"  Message: {error.user_message}"
                 if error.suggested_actions:
-                    lines.append(f"  Actions: {'; '.join(error.suggested_actions[:2])}")
-                lines.append("")
-        
-        return "\n".join(lines)
+                    yield f"  Actions: {'; '.join(error.suggested_actions[:2])}"
+                yield ""
     
     def _generate_json_report(self, include_history: bool, max_errors: int) -> str:
         """Generate JSON format error report."""
-        report_data = {
+        report_data = self._json_report_header()
+        
+        if include_history:
+            recent_errors = self.error_history[-max_errors:]
+            report_data['errors'] = [error.to_dict() for error in recent_errors]
+        
+        return json.dumps(report_data, indent=2, default=str)
+    
+    def _json_report_header(self) -> Dict[str, Any]:
+        """Build the session-level fields shared by JSON reports."""
+        return {
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'session_id': self.session_id,
             'summary': self.get_error_summary(),
             'system_info': self.system_info.to_dict() if self.system_info else None
         }
+    
+    def _iter_json_report(self, include_history: bool, max_errors: int) -> Iterator[bytes]:
+        """
+        Yield a JSON Lines error report, one encoded record per line.
         
-        if include_history:
-            recent_errors = self.error_history[-max_errors:]
-            report_data['errors'] = [error.to_dict() for error in recent_errors]
+        The first record holds the session header; each following record is
+        a single error report, so the export can be parsed incrementally.
+        """
+        yield _dumps_line(self._json_report_header())
         
-        return json.dumps(report_data, indent=2, default=str)
+        if include_history:
+            for error in self.error_history[-max_errors:]:
+                yield _dumps_line(error.to_dict())
     
     def _generate_markdown_report(self, include_history: bool, max_errors: int) -> str:
         """Generate Markdown format error report."""
-        lines = []
-        lines.append("# LinkedIn Post Extractor - Error Report")
-        lines.append("")
-        lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"**Session ID:** `{self.session_id}`")
-        lines.append("")
+        return "\n".join(self._iter_markdown_report(include_history, max_errors))
+    
+    def _iter_markdown_report(self, include_history: bool, max_errors: int) -> Iterator[str]:
+        """Yield Markdown format error report lines."""
+        yield "# LinkedIn Post Extractor - Error Report"
+        yield ""
+        yield f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield f"**Session ID:** `{self.session_id}`"
+        yield ""
         
         # Summary
         summary = self.get_error_summary()
-        lines.append("## Error Summary (Last 24 Hours)")
-        lines.append("")
-        lines.append(f"- **Total Errors:** {summary['total_errors']}")
-        lines.append(f"- **Recovery Rate:** {summary['recovery_rate']:.1%}")
+        yield "## Error Summary (Last 24 Hours)"
+        yield ""
+        yield f"- **Total Errors:** {summary['total_errors']}"
+        yield f"- **Recovery Rate:** {summary['recovery_rate']:.1%}"
         
         if summary['most_common_error']:
             error_type, count = summary['most_common_error']
-            lines.append(f"- **Most Common:** {error_type} ({count} times)")
+            yield f"- **Most Common:** {error_type} ({count} times)"
         
-        lines.append("")
+        yield ""
         
         # Error distribution
         if summary['error_types']:
-            lines.append("### Error Types")
-            lines.append("")
+            yield "### Error Types"
+            yield ""
             for error_type, count in summary['error_types'].items():
-                lines.append(f"- **{error_type}:** {count}")
-            lines.append("")
+                yield f"- **{error_type}:** {count}"
+            yield ""
         
         # Recent errors
         if include_history and self.error_history:
-            lines.append("## Recent Errors")
-            lines.append("")
+            yield "## Recent Errors"
+            yield ""
             
             recent_errors = self.error_history[-max_errors:]
             for error in reversed(recent_errors):
-                lines.append(f"### {error.error_type} - {error.severity.value.title()}")
-                lines.append(f"**Time:** {error.timestamp.strftime('%H:%M:%S')}")
-                lines.append(f"**Message:** {error.user_message}")
+                yield f"### {error.error_type} - {error.severity.value.title()}"
+                yield f"**Time:** {error.timestamp.strftime('%H:%M:%S')}"
+                yield f"**Message:** {error.user_message}"
                 
                 if error.suggested_actions:
-                    lines.append("**Suggested Actions:**")
+                    yield "**Suggested Actions:**"
                     for action in error.suggested_actions:
-                        lines.append(f"- {action}")
+                        yield f"- {action}"
                 
-                lines.append("")
-        
-        return "\n".join(lines)
+                yield ""
     
     def _generate_html_report(self, include_history: bool, max_errors: int) -> str:
         """Generate HTML format error report."""
+        return "".join(self._iter_html_report(include_history, max_errors))
+    
+    def _iter_html_report(self, include_history: bool, max_errors: int) -> Iterator[str]:
+        """Yield HTML format error report chunks."""
         # This is a basic HTML template - could be enhanced with CSS styling
-        html = f"""
+        yield f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -687,7 +807,7 @@ class ErrorReporter:
         
         # Add summary
         summary = self.get_error_summary()
-        html += f"""
+        yield f"""
             <div class="summary">
                 <h2>Error Summary (Last 24 Hours)</h2>
                 <ul>
@@ -697,17 +817,17 @@ class ErrorReporter:
         
         if summary['most_common_error']:
             error_type, count = summary['most_common_error']
-            html += f"<li>Most Common: {error_type} ({count} times)</li>"
+            yield f"<li>Most Common: {error_type} ({count} times)</li>"
         
-        html += "</ul></div>"
+        yield "</ul></div>"
         
         # Add recent errors
         if include_history and self.error_history:
-            html += "<h2>Recent Errors</h2>"
+            yield "<h2>Recent Errors</h2>"
             
             recent_errors = self.error_history[-max_errors:]
             for error in reversed(recent_errors):
-                html += f"""
+                yield f"""
                 <div class="error {error.severity.value}">
                     <h3>{error.error_type} - {error.severity.value.title()}</h3>
                     <p><strong>Time:</strong> {error.timestamp.strftime('%H:%M:%S')}</p>
@@ -715,15 +835,14 @@ class ErrorReporter:
                 """
                 
                 if error.suggested_actions:
-                    html += "<p><strong>Suggested Actions:</strong></p><ul>"
+                    yield "<p><strong>Suggested Actions:</strong></p><ul>"
                     for action in error.suggested_actions:
-                        html += f"<li>{action}</li>"
-                    html += "</ul>"
+                        yield f"<li>{action}</li>"
+                    yield "</ul>"
                 
-                html += "</div>"
+                yield "</div>"
         
-        html += "</body></html>"
-        return html
+        yield "</body></html>"
     
     def clear_history(self):
         """Clear error history and reset counters."""
@@ -738,16 +857,32 @@ class ErrorReporter:
         """
         Export error reports to file.
         
+        The report is written chunk by chunk rather than built in memory
+        first. Note that JSON exports use the JSON Lines layout: the first
+        line is the session header and each following line is one error
+        report. This differs from generate_report(), which returns a single
+        JSON document, so readers of exported files must parse them line by
+        line.
+        
         Args:
             file_path: Path to export file
             format: Export format
             max_errors: Maximum number of errors to export
         """
         try:
-            report_content = self.generate_report(format, True, max_errors)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(report_content)
+            if format == ReportFormat.JSON:
+                with open(file_path, 'wb') as f:
+                    f.writelines(self._iter_json_report(True, max_errors))
+            elif format == ReportFormat.HTML:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.writelines(self._iter_html_report(True, max_errors))
+            else:
+                if format == ReportFormat.MARKDOWN:
+                    lines = self._iter_markdown_report(True, max_errors)
+                else:
+                    lines = self._iter_text_report(True, max_errors)
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.writelines(f"{line}\n" for line in lines)
             
             logger.info(f"Error report exported to {file_path}")
             
@@ -755,6 +890,13 @@ class ErrorReporter:
             logger.error(f"Failed to export error report: {e}")
 
 
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Encode a record as a single newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, default=str) + '\n').encode('utf-8')
+
+
 # Utility functions
 def create_error_reporter(log_file: Optional[str] = None,
                          include_system_info: bool = True) -> ErrorReporter:
@@ -774,15 +916,19 @@ def create_error_reporter(log_file: Optional[str] = None,
     )
 
 
-# Global error reporter instance
+# Global error reporter instance, created once on first use
 _global_reporter: Optional[ErrorReporter] = None
+_global_reporter_lock = threading.Lock()
 
 
 def get_global_error_reporter() -> ErrorReporter:
     """Get or create the global error reporter instance."""
     global _global_reporter
+    # Double-checked so only the first calls pay for the lock
     if _global_reporter is None:
-        _global_reporter = create_error_reporter()
+        with _global_reporter_lock:
+            if _global_reporter is None:
+                _global_reporter = create_error_reporter()
     return _global_reporter
 
 
@@ -803,7 +949,7 @@ def report_error(exception: Exception,
         ErrorReport object
     """
     reporter = get_global_error_reporter()
-    context = reporter.create_error_context(module_name, function_name)
+    context = reporter.create_error_context(module_name, function_name, exc=exception)
     return reporter.report_error(exception, context, **kwargs)
 
 
@@ -7,9 +7,14 @@ handling and categorization.
 """
 
 import logging
+import sys
 from typing import Optional, Dict, Any, List
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 
+# Slotted dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ErrorCategory(Enum):
     """Categorization of errors for better handling and reporting."""
@@ -26,6 +31,9 @@ class ErrorCategory(Enum):
 class LinkedInExtractorError(Exception):
     """Base exception class for LinkedIn Post Extractor application."""
     
+    # Marker for cheap duck-typed checks (getattr instead of isinstance)
+    __linkedin_error__ = True
+    
     def __init__(self, message: str, error_code: Optional[str] = None, 
                  context: Optional[Dict[str, Any]] = None):
         super().__init__(message)
@@ -80,27 +88,67 @@ class ConfigurationError(LinkedInExtractorError):
     pass
 
 
+# Exact-type lookup tables for the dispatchers below. Types not listed here
+# (e.g. third-party subclasses) fall back to the isinstance checks.
+_CATEGORY_MAP: Dict[type, ErrorCategory] = {
+    LinkedInExtractorError: ErrorCategory.UNKNOWN,
+    NetworkError: ErrorCategory.NETWORK,
+    RateLimitError: ErrorCategory.NETWORK,
+    AuthenticationError: ErrorCategory.AUTHENTICATION,
+    ExtractionError: ErrorCategory.EXTRACTION,
+    ValidationError: ErrorCategory.VALIDATION,
+    BrowserError: ErrorCategory.BROWSER,
+    ScrollError: ErrorCategory.BROWSER,
+    ConfigurationError: ErrorCategory.CONFIGURATION,
+}
+
+# Ordered isinstance fallback for subclasses missing from _CATEGORY_MAP
+_CATEGORY_TUPLES = (
+    ((NetworkError,), ErrorCategory.NETWORK),
+    ((AuthenticationError,), ErrorCategory.AUTHENTICATION),
+    ((ExtractionError,), ErrorCategory.EXTRACTION),
+    ((ValidationError,), ErrorCategory.VALIDATION),
+    ((BrowserError,), ErrorCategory.BROWSER),
+    ((ConfigurationError,), ErrorCategory.CONFIGURATION),
+)
+_CATEGORIZED_TYPES = tuple(t for types, _ in _CATEGORY_TUPLES for t in types)
+
+_RECOVERABLE_TYPES = frozenset({NetworkError, RateLimitError, ScrollError})
+
+_SEVERITY_MAP: Dict[type, str] = {
+    LinkedInExtractorError: "low",
+    AuthenticationError: "critical",
+    ConfigurationError: "critical",
+    NetworkError: "high",
+    RateLimitError: "high",
+    BrowserError: "high",
+    ScrollError: "high",
+    ExtractionError: "high",
+    ValidationError: "medium",
+}
+
+
 def get_error_category(error: Exception) -> ErrorCategory:
     """Get the category of an error based on its type."""
-    if isinstance(error, NetworkError):
-        return ErrorCategory.NETWORK
-    elif isinstance(error, AuthenticationError):
-        return ErrorCategory.AUTHENTICATION
-    elif isinstance(error, ExtractionError):
-        return ErrorCategory.EXTRACTION
-    elif isinstance(error, ValidationError):
-        return ErrorCategory.VALIDATION
-    elif isinstance(error, BrowserError):
-        return ErrorCategory.BROWSER
-    elif isinstance(error, ConfigurationError):
-        return ErrorCategory.CONFIGURATION
-    else:
+    category = _CATEGORY_MAP.get(type(error))
+    if category is not None:
+        return category
+    
+    # One tuple isinstance check rules out unrelated exception types
+    if not isinstance(error, _CATEGORIZED_TYPES):
         return ErrorCategory.UNKNOWN
+    
+    for types, category in _CATEGORY_TUPLES:
+        if isinstance(error, types):
+            return category
+    return ErrorCategory.UNKNOWN
 
 
 def is_recoverable_error(error: Exception) -> bool:
     """Determine if an error is recoverable through retry."""
-    if isinstance(error, (NetworkError, RateLimitError, ScrollError)):
+    if type(error) in _RECOVERABLE_TYPES:
+        return True
+    elif isinstance(error, (NetworkError, RateLimitError, ScrollError)):
         return True
     elif isinstance(error, (AuthenticationError, ValidationError, ConfigurationError)):
         return False
@@ -131,26 +179,39 @@ def handle_error_with_context(error: Exception, context: Dict[str, Any],
 
 
 def chain_exceptions(primary_error: Exception, secondary_error: Exception) -> Exception:
-    """Chain exceptions to preserve error context."""
-    return LinkedInExtractorError(
+    """
+    Chain exceptions to preserve error context.
+    
+    Returns a new LinkedInExtractorError whose ``__cause__`` is the secondary
+    error, so its traceback is kept; the caller's exceptions are not modified.
+    """
+    chained = LinkedInExtractorError(
         f"Primary error: {primary_error}. Secondary error: {secondary_error}",
         context={"primary_error": str(primary_error), "secondary_error": str(secondary_error)}
     )
+    chained.__cause__ = secondary_error
+    return chained
 
 
 def format_error_message(error: Exception, include_context: bool = True) -> str:
     """Format error message for user display."""
     message = str(error)
     
-    if include_context and isinstance(error, LinkedInExtractorError) and error.context:
-        context_str = ", ".join([f"{k}: {v}" for k, v in error.context.items()])
-        message = f"{message} (Context: {context_str})"
+    if include_context and getattr(error, '__linkedin_error__', False):
+        context = error.context
+        if context:
+            context_str = ", ".join([f"{k}: {v}" for k, v in context.items()])
+            message = f"{message} (Context: {context_str})"
     
     return message
 
 
 def get_error_severity(error: Exception) -> str:
     """Get the severity level of an error."""
+    severity = _SEVERITY_MAP.get(type(error))
+    if severity is not None:
+        return severity
+    
     if isinstance(error, (AuthenticationError, ConfigurationError)):
         return "critical"
     elif isinstance(error, (NetworkError, BrowserError, ExtractionError)):
@@ -161,17 +222,47 @@ def get_error_severity(error: Exception) -> str:
         return "low"
 
 
-def create_error_report(error: Exception, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+@dataclass(**_DATACLASS_SLOTS)
+class ErrorReportData:
+    """
+    Lightweight structured error report produced by create_error_report.
+    
+    Supports ``report["field"]`` lookups so code written against the old
+    dict return value keeps working.
+    """
+    error_type: str
+    message: str
+    category: str
+    severity: str
+    recoverable: bool
+    context: Dict[str, Any]
+    error_code: Optional[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+    
+    def __getitem__(self, key: str) -> Any:
+        """Look up a field by name, as on the dict this class replaced."""
+        if key not in _REPORT_DATA_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+_REPORT_DATA_FIELDS = frozenset(field.name for field in fields(ErrorReportData))
+
+
+def create_error_report(error: Exception, context: Optional[Dict[str, Any]] = None) -> ErrorReportData:
     """Create a comprehensive error report."""
-    return {
-        "error_type": type(error).__name__,
-        "message": str(error),
-        "category": get_error_category(error).value,
-        "severity": get_error_severity(error),
-        "recoverable": is_recoverable_error(error),
-        "context": context or {},
-        "error_code": getattr(error, 'error_code', None),
-    }
+    return ErrorReportData(
+        error_type=type(error).__name__,
+        message=str(error),
+        category=get_error_category(error).value,
+        severity=get_error_severity(error),
+        recoverable=is_recoverable_error(error),
+        context=context or {},
+        error_code=getattr(error, 'error_code', None),
+    )
 
 
 # Export all public classes and functions
@@ -186,6 +277,7 @@ __all__ = [
     "RateLimitError",
     "ConfigurationError",
     "ErrorCategory",
+    "ErrorReportData",
     "get_error_category",
     "is_recoverable_error",
     "create_error_context",
@@ -5,18 +5,65 @@ This module provides functionality to convert extracted LinkedIn posts into
 well-formatted Markdown files with metadata, proper structure, and readable layout.
 """
 
+import functools
+import itertools
+import json
 import os
 import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Iterable, Iterator, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from content_parser import PostData
 from config import OUTPUT_CONFIG, MARKDOWN_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for generated files, large enough to hold most exports whole
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Engagement metrics summed across posts for the summary section
+_ENGAGEMENT_METRICS = ('likes', 'comments', 'shares')
+
+# Templates resolved once at import instead of on every file
+_HEADER_TEMPLATE = MARKDOWN_TEMPLATE['header']
+_EMPTY_PROFILE_TEMPLATE = MARKDOWN_TEMPLATE['empty_profile_template']
+
+# Runs of filename-invalid characters and dashes, collapsed to a single dash
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*\-]+')
+
+# Any character that _escape_markdown would escape
+_MD_META_RE = re.compile(r'[\\`*_{}\[\]()#+\-.!|]')
+
+
+@functools.lru_cache(maxsize=64)
+def _pretty_post_type(post_type: str) -> str:
+    """Human readable form of a post type, e.g. 'shared_content' -> 'Shared Content'."""
+    return post_type.replace('_', ' ').title()
+
+
+@dataclass
+class _PostStats:
+    """Aggregates collected in a single pass over a profile's posts."""
+    post_types: Counter = field(default_factory=Counter)
+    hashtags: Set[str] = field(default_factory=set)
+    authors: Set[str] = field(default_factory=set)
+    total_engagement: Dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(_ENGAGEMENT_METRICS, 0)
+    )
+    earliest: Optional[datetime] = None
+    latest: Optional[datetime] = None
+
 
 class MarkdownGenerator:
     """
@@ -26,6 +73,12 @@ class MarkdownGenerator:
     format with YAML frontmatter, proper formatting, and metadata preservation.
     """
     
+    # Translation table escaping Markdown special characters in one pass.
+    # A backslash becomes four backslashes, matching the output of the old
+    # replace() loop, which escaped it twice.
+    _ESCAPE_TABLE = str.maketrans({char: f'\\{char}' for char in r'`*_{}[]()#+-.!|'})
+    _ESCAPE_TABLE[ord('\\')] = '\\' * 4
+    
     def __init__(self, output_dir: str = "."):
         """
         Initialize the Markdown generator.
@@ -35,6 +88,7 @@ class MarkdownGenerator:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._stats_lock = threading.Lock()
         self.stats = {
             'files_created': 0,
             'posts_processed': 0,
@@ -61,9 +115,12 @@ class MarkdownGenerator:
             Path to the generated Markdown file
         """
         try:
+            # Read the clock once for the whole file
+            now = datetime.now()
+            
             # Generate filename if not provided
             if not filename:
-                filename = self._generate_filename(profile_name)
+                filename = self._generate_filename(profile_name, now)
             
             # Ensure .md extension
             if not filename.endswith('.md'):
@@ -71,32 +128,39 @@ class MarkdownGenerator:
             
             file_path = self.output_dir / filename
             
-            # Generate Markdown content
-            markdown_content = self._generate_markdown_content(
-                posts, profile_name, profile_url
-            )
-            
-            # Write to file
-            with open(file_path, 'w', encoding=OUTPUT_CONFIG['encoding']) as f:
-                f.write(markdown_content)
+            # Stream the Markdown content chunk by chunk into a temporary
+            # file, then rename it so a failure never leaves a partial file
+            encoding = OUTPUT_CONFIG['encoding']
+            chunks = self._iter_markdown_content(posts, profile_name, profile_url, now)
+            tmp_path = file_path.with_name(file_path.name + '.tmp')
+            try:
+                with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                    f.writelines(chunk.encode(encoding) for chunk in chunks)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
             
-            self.stats['files_created'] += 1
-            self.stats['posts_processed'] += len(posts)
+            with self._stats_lock:
+                self.stats['files_created'] += 1
+                self.stats['posts_processed'] += len(posts)
             
             logger.info(f"Generated Markdown file: {file_path}")
             return str(file_path)
             
         except Exception as e:
-            self.stats['errors'] += 1
+            with self._stats_lock:
+                self.stats['errors'] += 1
             logger.error(f"Failed to generate Markdown file: {e}")
             raise
     
-    def _generate_filename(self, profile_name: str) -> str:
+    def _generate_filename(self, profile_name: str, now: Optional[datetime] = None) -> str:
         """
         Generate a filename based on profile name and current date.
         
         Args:
             profile_name: Name of the LinkedIn profile
+            now: Generation time (defaults to the current time)
             
         Returns:
             Generated filename
@@ -105,7 +169,7 @@ class MarkdownGenerator:
         clean_name = self._sanitize_filename(profile_name)
         
         # Add current date
-        current_date = datetime.now().strftime(OUTPUT_CONFIG['date_format'])
+        current_date = (now or datetime.now()).strftime(OUTPUT_CONFIG['date_format'])
         
         # Use template
         filename = OUTPUT_CONFIG['filename_template'].format(
@@ -140,12 +204,8 @@ class MarkdownGenerator:
         Returns:
             Sanitized filename
         """
-        # Remove or replace invalid characters
-        invalid_chars = r'[<>:"/\\|?*]'
-        sanitized = re.sub(invalid_chars, '-', filename)
-        
-        # Remove multiple consecutive dashes
-        sanitized = re.sub(r'-+', '-', sanitized)
+        # Replace invalid characters, collapsing consecutive dashes
+        sanitized = _SANITIZE_RE.sub('-', filename)
         
         # Remove leading/trailing dashes and spaces
         sanitized = sanitized.strip('- ')
@@ -160,7 +220,8 @@ class MarkdownGenerator:
         self, 
         posts: List[PostData], 
         profile_name: str,
-        profile_url: str
+        profile_url: str,
+        now: Optional[datetime] = None
     ) -> str:
         """
         Generate the complete Markdown content.
@@ -169,37 +230,136 @@ class MarkdownGenerator:
             posts: List of PostData objects
             profile_name: Name of the LinkedIn profile
             profile_url: URL of the LinkedIn profile
+            now: Generation time (defaults to the current time)
             
         Returns:
             Complete Markdown content as string
         """
+        return ''.join(self._iter_markdown_content(posts, profile_name, profile_url, now))
+    
+    def _iter_markdown_content(
+        self, 
+        posts: List[PostData], 
+        profile_name: str,
+        profile_url: str,
+        now: Optional[datetime] = None
+    ) -> Iterator[str]:
+        """
+        Yield the Markdown content in chunks (one per post in the posts section).
+        
+        Non-empty sections are separated by a newline, so joining the
+        yielded chunks gives the complete file content.
+        
+        Args:
+            posts: List of PostData objects
+            profile_name: Name of the LinkedIn profile
+            profile_url: URL of the LinkedIn profile
+            now: Generation time (defaults to the current time)
+            
+        Yields:
+            Markdown content chunks
+        """
+        separator = ""
+        for section in self._iter_sections(posts, profile_name, profile_url, now):
+            started = False
+            for chunk in section:
+                if chunk:
+                    if not started:
+                        yield separator
+                        started = True
+                    yield chunk
+            if started:
+                separator = "\n"
+    
+    def _iter_sections(
+        self, 
+        posts: List[PostData], 
+        profile_name: str,
+        profile_url: str,
+        now: Optional[datetime]
+    ) -> Iterator[Iterable[str]]:
+        """Yield the frontmatter, header, posts and footer sections, each as an iterable of chunks."""
+        # Format the generation time once for every section
+        if now is None:
+            now = datetime.now()
+        extraction_iso = now.isoformat()
+        extraction_display = now.strftime("%B %d, %Y at %H:%M")
+        
+        # Aggregate post metadata once for frontmatter and summary
+        post_stats = self._collect_post_stats(posts)
+        
         # Start with YAML frontmatter
-        frontmatter = self._generate_frontmatter(posts, profile_name, profile_url)
+        yield (self._generate_frontmatter(
+            posts, profile_name, profile_url, extraction_iso, post_stats
+        ),)
         
         # Generate header
-        header = self._generate_header(posts, profile_name, profile_url)
+        yield (self._generate_header(
+            posts, profile_name, profile_url, extraction_display, post_stats
+        ),)
         
-        # Generate posts content
-        posts_content = self._generate_posts_content(posts)
+        # Generate posts content, one post at a time
+        yield self._iter_posts_content(posts, now)
         
         # Generate footer
-        footer = self._generate_footer(posts)
+        yield (self._generate_footer(posts, extraction_display),)
+    
+    def _collect_post_stats(self, posts: List[PostData]) -> _PostStats:
+        """
+        Collect post type counts, hashtags, authors, engagement totals and
+        date range in a single pass over the posts.
+        
+        Args:
+            posts: List of PostData objects
+            
+        Returns:
+            Aggregated post statistics
+        """
+        stats = _PostStats()
+        total_engagement = stats.total_engagement
+        earliest = latest = None
         
-        # Combine all parts
-        content_parts = [
-            frontmatter,
-            header,
-            posts_content,
-            footer
-        ]
+        # Bind hot-loop lookups to locals
+        post_types = stats.post_types
+        hashtags_update = stats.hashtags.update
+        authors_add = stats.authors.add
         
-        return '\n'.join(filter(None, content_parts))
+        for post in posts:
+            # Count post types
+            post_types[post.post_type] += 1
+            
+            # Collect hashtags
+            hashtags_update(post.hashtags)
+            
+            # Collect authors
+            author = post.author
+            if author:
+                authors_add(author)
+            
+            # Sum tracked engagement metrics
+            engagement_metrics = post.engagement_metrics
+            for metric in _ENGAGEMENT_METRICS:
+                total_engagement[metric] += engagement_metrics.get(metric, 0)
+            
+            # Track date range
+            timestamp = post.timestamp
+            if timestamp:
+                if earliest is None or timestamp < earliest:
+                    earliest = timestamp
+                if latest is None or timestamp > latest:
+                    latest = timestamp
+        
+        stats.earliest = earliest
+        stats.latest = latest
+        return stats
     
     def _generate_frontmatter(
         self, 
         posts: List[PostData], 
         profile_name: str,
-        profile_url: str
+        profile_url: str,
+        extraction_date: str,
+        post_stats: _PostStats
     ) -> str:
         """
         Generate YAML frontmatter for the Markdown file.
@@ -208,60 +368,50 @@ class MarkdownGenerator:
             posts: List of PostData objects
             profile_name: Name of the LinkedIn profile
             profile_url: URL of the LinkedIn profile
+            extraction_date: ISO formatted generation time
+            post_stats: Aggregated post statistics
             
         Returns:
             YAML frontmatter as string
+        
+        The metadata block is emitted as indented JSON, which is valid YAML
+        and keeps names, URLs and hashtags correctly quoted.
         """
-        extraction_date = datetime.now().isoformat()
+        hashtags = post_stats.hashtags
+        earliest = post_stats.earliest
+        latest = post_stats.latest
+        
+        metadata = {
+            "title": f"LinkedIn Posts - {profile_name}",
+            "profile_name": profile_name,
+            "profile_url": profile_url,
+            "extraction_date": extraction_date,
+            "total_posts": len(posts),
+            "post_types": post_stats.post_types,
+            "unique_hashtags": len(hashtags),
+            "top_hashtags": list(itertools.islice(hashtags, 10)),
+            "unique_authors": len(post_stats.authors),
+            "date_range": {
+                "earliest": earliest.isoformat() if earliest else None,
+                "latest": latest.isoformat() if latest else None,
+            },
+            "generated_by": "LinkedIn Post Extractor",
+        }
         
-        # Extract metadata from posts
-        post_types = {}
-        hashtags = set()
-        authors = set()
-        date_range = {'earliest': None, 'latest': None}
+        if orjson is not None:
+            body = orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            body = json.dumps(metadata, indent=2, ensure_ascii=False)
         
-        for post in posts:
-            # Count post types
-            post_types[post.post_type] = post_types.get(post.post_type, 0) + 1
-            
-            # Collect hashtags
-            hashtags.update(post.hashtags)
-            
-            # Collect authors
-            if post.author:
-                authors.add(post.author)
-            
-            # Track date range
-            if post.timestamp:
-                if date_range['earliest'] is None or post.timestamp < date_range['earliest']:
-                    date_range['earliest'] = post.timestamp
-                if date_range['latest'] is None or post.timestamp > date_range['latest']:
-                    date_range['latest'] = post.timestamp
-        
-        frontmatter = f"""---
-title: "LinkedIn Posts - {profile_name}"
-profile_name: "{profile_name}"
-profile_url: "{profile_url}"
-extraction_date: "{extraction_date}"
-total_posts: {len(posts)}
-post_types: {dict(post_types)}
-unique_hashtags: {len(hashtags)}
-top_hashtags: {list(hashtags)[:10]}
-unique_authors: {len(authors)}
-date_range:
-  earliest: "{date_range['earliest'].isoformat() if date_range['earliest'] else None}"
-  latest: "{date_range['latest'].isoformat() if date_range['latest'] else None}"
-generated_by: "LinkedIn Post Extractor"
----
-
-"""
-        return frontmatter
+        return f"---\n{body}\n---\n\n"
     
     def _generate_header(
         self, 
         posts: List[PostData], 
         profile_name: str,
-        profile_url: str
+        profile_url: str,
+        extraction_date: str,
+        post_stats: _PostStats
     ) -> str:
         """
         Generate the header section of the Markdown file.
@@ -270,31 +420,32 @@ generated_by: "LinkedIn Post Extractor"
             posts: List of PostData objects
             profile_name: Name of the LinkedIn profile
             profile_url: URL of the LinkedIn profile
+            extraction_date: Human readable generation time
+            post_stats: Aggregated post statistics
             
         Returns:
             Header content as string
         """
-        extraction_date = datetime.now().strftime("%B %d, %Y at %H:%M")
-        
-        header = MARKDOWN_TEMPLATE['header'].format(
-            profile_name=profile_name,
-            extraction_date=extraction_date,
-            profile_url=profile_url,
-            total_posts=len(posts)
-        )
+        header = _HEADER_TEMPLATE.format_map({
+            'profile_name': profile_name,
+            'extraction_date': extraction_date,
+            'profile_url': profile_url,
+            'total_posts': len(posts)
+        })
         
         # Add summary statistics
-        summary_stats = self._generate_summary_stats(posts)
+        summary_stats = self._generate_summary_stats(posts, post_stats)
         header += summary_stats
         
         return header
     
-    def _generate_summary_stats(self, posts: List[PostData]) -> str:
+    def _generate_summary_stats(self, posts: List[PostData], post_stats: _PostStats) -> str:
         """
         Generate summary statistics section.
         
         Args:
             posts: List of PostData objects
+            post_stats: Aggregated post statistics
             
         Returns:
             Summary statistics as string
@@ -302,69 +453,73 @@ generated_by: "LinkedIn Post Extractor"
         if not posts:
             return ""
         
-        # Calculate statistics
-        post_types = {}
-        total_engagement = {'likes': 0, 'comments': 0, 'shares': 0}
-        hashtags = set()
+        post_types = post_stats.post_types
+        total_engagement = post_stats.total_engagement
+        hashtags = post_stats.hashtags
         
-        for post in posts:
-            post_types[post.post_type] = post_types.get(post.post_type, 0) + 1
-            hashtags.update(post.hashtags)
-            
-            for metric, value in post.engagement_metrics.items():
-                if metric in total_engagement:
-                    total_engagement[metric] += value
-        
-        stats = "## 📊 Summary Statistics\n\n"
+        stats = ["## 📊 Summary Statistics\n\n"]
         
         if post_types:
-            stats += "### Post Types\n"
+            stats.append("### Post Types\n")
+            total_posts = len(posts)
             for post_type, count in post_types.items():
-                percentage = (count / len(posts)) * 100
-                stats += f"- **{post_type.replace('_', ' ').title()}**: {count} ({percentage:.1f}%)\n"
-            stats += "\n"
+                percentage = (count / total_posts) * 100
+                stats.append(f"- **{_pretty_post_type(post_type)}**: {count} ({percentage:.1f}%)\n")
+            stats.append("\n")
         
         if any(total_engagement.values()):
-            stats += "### Total Engagement\n"
+            stats.append("### Total Engagement\n")
             for metric, value in total_engagement.items():
                 if value > 0:
-                    stats += f"- **{metric.title()}**: {value:,}\n"
-            stats += "\n"
+                    stats.append(f"- **{metric.title()}**: {value:,}\n")
+            stats.append("\n")
         
         if hashtags:
-            top_hashtags = list(hashtags)[:10]
-            stats += f"### Top Hashtags ({len(hashtags)} unique)\n"
+            top_hashtags = itertools.islice(hashtags, 10)
+            stats.append(f"### Top Hashtags ({len(hashtags)} unique)\n")
             for hashtag in top_hashtags:
-                stats += f"- {hashtag}\n"
-            stats += "\n"
+                stats.append(f"- {hashtag}\n")
+            stats.append("\n")
         
-        stats += "---\n\n"
-        return stats
+        stats.append("---\n\n")
+        return ''.join(stats)
     
-    def _generate_posts_content(self, posts: List[PostData]) -> str:
+    def _generate_posts_content(self, posts: List[PostData], now: datetime) -> str:
         """
         Generate the posts content section.
         
         Args:
             posts: List of PostData objects
+            now: Generation time
             
         Returns:
             Posts content as string
         """
+        return ''.join(self._iter_posts_content(posts, now))
+    
+    def _iter_posts_content(self, posts: List[PostData], now: datetime) -> Iterator[str]:
+        """
+        Yield the posts content section one post at a time.
+        
+        Args:
+            posts: List of PostData objects
+            now: Generation time
+            
+        Yields:
+            Posts content chunks
+        """
         if not posts:
-            return MARKDOWN_TEMPLATE['empty_profile_template'].format(
-                profile_name="Profile",
-                extraction_date=datetime.now().strftime("%B %d, %Y"),
-                profile_url=""
-            )
+            yield _EMPTY_PROFILE_TEMPLATE.format_map({
+                'profile_name': "Profile",
+                'extraction_date': now.strftime("%B %d, %Y"),
+                'profile_url': ""
+            })
+            return
         
-        content = "## 📝 Posts\n\n"
+        yield "## 📝 Posts\n\n"
         
         for i, post in enumerate(posts, 1):
-            post_content = self._format_post(post, i)
-            content += post_content + "\n"
-        
-        return content
+            yield self._format_post(post, i) + "\n"
     
     def _format_post(self, post: PostData, post_number: int) -> str:
         """
@@ -387,14 +542,15 @@ generated_by: "LinkedIn Post Extractor"
         escaped_content = self._escape_markdown(post.content)
         
         # Build post content
-        post_md = f"### Post #{post_number}\n\n"
+        parts = [f"### Post #{post_number}\n\n"]
+        append = parts.append
         
         # Add metadata
         metadata = []
         if post.author:
             metadata.append(f"**Author**: {post.author}")
         metadata.append(f"**Date**: {post_date}")
-        metadata.append(f"**Type**: {post.post_type.replace('_', ' ').title()}")
+        metadata.append(f"**Type**: {_pretty_post_type(post.post_type)}")
         
         if post.engagement_metrics:
             engagement_parts = []
@@ -405,43 +561,42 @@ generated_by: "LinkedIn Post Extractor"
                 metadata.append(f"**Engagement**: {', '.join(engagement_parts)}")
         
         if metadata:
-            post_md += "\n".join(metadata) + "\n\n"
+            append("\n".join(metadata))
+            append("\n\n")
         
         # Add content
-        post_md += "**Content**:\n"
+        append("**Content**:\n")
         if escaped_content:
-            post_md += f"> {escaped_content}\n\n"
+            append(f"> {escaped_content}\n\n")
         else:
-            post_md += "> *No text content*\n\n"
+            append("> *No text content*\n\n")
         
         # Add images if present
         if post.images:
-            post_md += "**Images**:\n"
-            for img_url in post.images:
-                post_md += f"- ![Post Image]({img_url})\n"
-            post_md += "\n"
+            append("**Images**:\n- ")
+            append("\n- ".join([f"![Post Image]({img_url})" for img_url in post.images]))
+            append("\n\n")
         
         # Add hashtags if present
         if post.hashtags:
-            post_md += f"**Hashtags**: {' '.join(post.hashtags)}\n\n"
+            append(f"**Hashtags**: {' '.join(post.hashtags)}\n\n")
         
         # Add mentions if present
         if post.mentions:
-            post_md += f"**Mentions**: {' '.join(post.mentions)}\n\n"
+            append(f"**Mentions**: {' '.join(post.mentions)}\n\n")
         
         # Add external links if present
         if post.external_links:
-            post_md += "**External Links**:\n"
-            for link in post.external_links:
-                post_md += f"- {link}\n"
-            post_md += "\n"
+            append("**External Links**:\n- ")
+            append("\n- ".join(post.external_links))
+            append("\n\n")
         
         # Add post URL if available
         if post.post_url:
-            post_md += f"[View Original Post]({post.post_url})\n\n"
+            append(f"[View Original Post]({post.post_url})\n\n")
         
-        post_md += "---\n"
-        return post_md
+        append("---\n")
+        return ''.join(parts)
     
     def _escape_markdown(self, text: str) -> str:
         """
@@ -456,22 +611,19 @@ generated_by: "LinkedIn Post Extractor"
         if not text:
             return ""
         
-        # Characters that need escaping in Markdown
-        escape_chars = r'\\`*_{}[]()#+-.!|'
-        
-        # Escape each character
-        escaped = text
-        for char in escape_chars:
-            escaped = escaped.replace(char, f'\\{char}')
+        # Plain prose needs no escaping
+        if not _MD_META_RE.search(text):
+            return text
         
-        return escaped
+        return text.translate(self._ESCAPE_TABLE)
     
-    def _generate_footer(self, posts: List[PostData]) -> str:
+    def _generate_footer(self, posts: List[PostData], export_date: str) -> str:
         """
         Generate the footer section.
         
         Args:
             posts: List of PostData objects
+            export_date: Human readable generation time
             
         Returns:
             Footer content as string
@@ -483,7 +635,7 @@ generated_by: "LinkedIn Post Extractor"
 ## 📄 Export Information
 
 - **Total Posts Exported**: {len(posts)}
-- **Export Date**: {datetime.now().strftime("%B %d, %Y at %H:%M")}
+- **Export Date**: {export_date}
 - **Generated by**: LinkedIn Post Extractor
 - **Format**: Markdown with YAML frontmatter
 
@@ -507,15 +659,17 @@ generated_by: "LinkedIn Post Extractor"
         Returns:
             Dictionary with generation statistics
         """
-        return self.stats.copy()
+        with self._stats_lock:
+            return self.stats.copy()
     
     def reset_stats(self):
         """Reset generation statistics."""
-        self.stats = {
-            'files_created': 0,
-            'posts_processed': 0,
-            'errors': 0
-        }
+        with self._stats_lock:
+            self.stats = {
+                'files_created': 0,
+                'posts_processed': 0,
+                'errors': 0
+            }
 
 
 def generate_markdown_from_posts(
@@ -542,6 +696,53 @@ def generate_markdown_from_posts(
     return generator.generate_markdown_file(posts, profile_name, profile_url, filename)
 
 
+def generate_markdown_batch(
+    jobs: List[Tuple[List[PostData], str, str]],
+    output_dir: str = ".",
+    max_workers: int = 8
+) -> List[str]:
+    """
+    Generate Markdown files for several profiles concurrently.
+    
+    Each job is written by a shared MarkdownGenerator on a thread pool, so
+    file I/O for one profile overlaps with formatting for another. Jobs whose
+    profile names resolve to the same filename get a numeric suffix
+    (``-2``, ``-3``, ...) so concurrent writes never target the same path.
+    
+    Args:
+        jobs: List of (posts, profile_name, profile_url) tuples
+        output_dir: Output directory for the files
+        max_workers: Maximum number of worker threads
+        
+    Returns:
+        Paths to the generated Markdown files, in job order
+    """
+    generator = MarkdownGenerator(output_dir)
+    
+    # Resolve every target filename up front so duplicates are caught
+    # before any job is submitted
+    now = datetime.now()
+    filenames = []
+    seen: Set[str] = set()
+    for _, profile_name, _ in jobs:
+        stem = generator._generate_filename(profile_name, now)
+        if stem.endswith('.md'):
+            stem = stem[:-3]
+        filename = f"{stem}.md"
+        suffix = 1
+        while filename.lower() in seen:
+            suffix += 1
+            filename = f"{stem}-{suffix}.md"
+        seen.add(filename.lower())
+        filenames.append(filename)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda job, filename: generator.generate_markdown_file(*job, filename=filename),
+            jobs, filenames
+        ))
+
+
 def preview_markdown_content(
     posts: List[PostData],
     profile_name: str,
@@ -6,12 +6,22 @@ allowing the system to continue processing when some data cannot be extracted.
 """
 
 import logging
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple, Sequence
 from enum import Enum
 
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:
+    np = None
+    njit = None
+    prange = None
+
 logger = logging.getLogger(__name__)
 
+# Shared result for the common no-suggestions case
+_EMPTY_SUGGESTIONS: Tuple[str, ...] = ()
+
 
 class ExtractionStrategy(Enum):
     """Strategies for handling partial extraction failures."""
@@ -21,33 +31,129 @@ class ExtractionStrategy(Enum):
     PARTIAL_CONTENT = "partial_content"
 
 
-@dataclass
+def _compute_stats(successful: int, total: int) -> Tuple[float, float]:
+    """Return (success_rate, quality_score) for the given item counts."""
+    rate = successful / total if total else 0.0
+    return rate, min(rate * 1.2, 1.0)  # Boost quality slightly
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _aggregate_stats_jit(successful, total):
+        n = successful.shape[0]
+        rates = np.zeros(n)
+        qualities = np.zeros(n)
+        for i in prange(n):
+            if total[i] > 0:
+                rate = successful[i] / total[i]
+                rates[i] = rate
+                qualities[i] = min(rate * 1.2, 1.0)
+        return rates, qualities
+else:
+    _aggregate_stats_jit = None
+
+
+def aggregate_stats(successful: Sequence[int],
+                    total: Sequence[int]) -> Tuple[List[float], List[float]]:
+    """
+    Compute success rates and quality scores for many results at once.
+    
+    Uses a parallel Numba kernel when numba is installed, which pays off for
+    large batches (e.g. dashboards aggregating thousands of results).
+    
+    Args:
+        successful: Successful item count per result
+        total: Total item count per result
+        
+    Returns:
+        Tuple of (success_rates, quality_scores) lists
+    """
+    if _aggregate_stats_jit is not None:
+        rates, qualities = _aggregate_stats_jit(
+            np.asarray(successful, dtype=np.float64),
+            np.asarray(total, dtype=np.float64)
+        )
+        return rates.tolist(), qualities.tolist()
+    
+    rates = []
+    qualities = []
+    for succ, tot in zip(successful, total):
+        rate, quality = _compute_stats(succ, tot)
+        rates.append(rate)
+        qualities.append(quality)
+    return rates, qualities
+
+
+class ExtractedItem(NamedTuple):
+    """Data recovered for one extraction item."""
+    index: int
+    data: Any
+    timestamp: Optional[str] = None
+    partial: bool = False
+
+
+class FailedItem(NamedTuple):
+    """Record of one failed extraction item."""
+    index: int
+    error: str
+    partial_data: Any = None
+
+
 class PartialExtractionResult:
     """Result of partial extraction operation."""
-    total_items: int = 0
-    successful_items: int = 0
-    failed_items: int = 0
-    success_rate: float = 0.0
-    quality_score: float = 0.0
     
-    # Detailed results
-    extracted_data: List[Dict[str, Any]] = field(default_factory=list)
-    failed_extractions: List[Dict[str, Any]] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+    # Slotted to avoid a per-instance __dict__ on this frequently built record
+    __slots__ = (
+        "total_items", "successful_items", "failed_items",
+        "success_rate", "quality_score",
+        "extracted_data", "failed_extractions", "warnings",
+    )
     
-    # Statistics
-    success_count: int = 0
-    failure_count: int = 0
+    def __init__(self,
+                 total_items: int = 0,
+                 successful_items: int = 0,
+                 failed_items: int = 0,
+                 success_rate: float = 0.0,
+                 quality_score: float = 0.0,
+                 extracted_data: Optional[List[ExtractedItem]] = None,
+                 failed_extractions: Optional[List[FailedItem]] = None,
+                 warnings: Optional[List[str]] = None):
+        self.total_items = total_items
+        self.successful_items = successful_items
+        self.failed_items = failed_items
+        self.success_rate = success_rate
+        self.quality_score = quality_score
+        
+        # Detailed results
+        self.extracted_data = extracted_data if extracted_data is not None else []
+        self.failed_extractions = failed_extractions if failed_extractions is not None else []
+        self.warnings = warnings if warnings is not None else []
+        
+        self.__post_init__()
     
     def __post_init__(self):
         """Calculate derived statistics."""
         if self.total_items > 0:
-            self.success_rate = self.successful_items / self.total_items
-            self.quality_score = min(self.success_rate * 1.2, 1.0)  # Boost quality slightly
-        
-        # Sync counts
-        self.success_count = self.successful_items
-        self.failure_count = self.failed_items
+            self.success_rate, self.quality_score = _compute_stats(self.successful_items, self.total_items)
+    
+    @property
+    def success_count(self) -> int:
+        """Alias of successful_items."""
+        return self.successful_items
+    
+    @property
+    def failure_count(self) -> int:
+        """Alias of failed_items."""
+        return self.failed_items
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -86,6 +192,57 @@ class PartialExtractionHandler:
         self.min_success_rate = min_success_rate
         self.quality_threshold = quality_threshold
     
+    @property
+    def strategy(self) -> ExtractionStrategy:
+        """Strategy for handling failures."""
+        return self._strategy
+    
+    @strategy.setter
+    def strategy(self, strategy: ExtractionStrategy):
+        # Resolve the strategy's failed-item handler once, not per item
+        self._strategy = strategy
+        self._handle_failed_data = getattr(self, self._strategy_table[strategy])
+    
+    @property
+    def min_success_rate(self) -> float:
+        """Minimum acceptable success rate."""
+        return self._min_success_rate
+    
+    @min_success_rate.setter
+    def min_success_rate(self, value: float):
+        # Threshold text is formatted once here rather than on every warning
+        self._min_success_rate = value
+        self._success_threshold_str = f"{value:.1%}"
+    
+    @property
+    def quality_threshold(self) -> float:
+        """Minimum quality threshold."""
+        return self._quality_threshold
+    
+    @quality_threshold.setter
+    def quality_threshold(self, value: float):
+        self._quality_threshold = value
+        self._quality_threshold_str = f"{value:.1%}"
+    
+    @staticmethod
+    def _discard_partial(index: int, data: Any) -> Optional[ExtractedItem]:
+        """Leave partial data of a failed item out of the extracted data."""
+        return None
+    
+    @staticmethod
+    def _merge_partial(index: int, data: Any) -> Optional[ExtractedItem]:
+        """Include partial data of a failed item in the extracted data."""
+        return ExtractedItem(index, data, None, True)
+    
+    # Failed-item handler per strategy; RETRY_FAILED and FALLBACK_EXTRACTION
+    # are resolved by the caller, so their partial data is skipped here
+    _strategy_table = {
+        ExtractionStrategy.SKIP_FAILED: "_discard_partial",
+        ExtractionStrategy.RETRY_FAILED: "_discard_partial",
+        ExtractionStrategy.FALLBACK_EXTRACTION: "_discard_partial",
+        ExtractionStrategy.PARTIAL_CONTENT: "_merge_partial",
+    }
+    
     def handle_partial_extraction(self, 
                                  extraction_results: List[Tuple[bool, Any, Optional[str]]],
                                  context: Optional[Dict[str, Any]] = None) -> PartialExtractionResult:
@@ -100,66 +257,66 @@ class PartialExtractionHandler:
             PartialExtractionResult with processed data
         """
         result = PartialExtractionResult()
-        result.total_items = len(extraction_results)
         
-        successful_data = []
-        failed_data = []
-        warnings = []
+        warnings = result.warnings
+        handle_failed_data = self._handle_failed_data
+        succ = 0
+        fail = 0
+        
+        # Pre-sized buffers filled by index and trimmed after the loop;
+        # partial items are kept apart so they follow the complete ones
+        n = len(extraction_results)
+        extracted_buf = [None] * n
+        failed_buf = [None] * n
+        partial_items = []
+        fi = 0
         
+        # Single pass: count, collect and apply the strategy per item
         for i, (success, data, error_msg) in enumerate(extraction_results):
             if success:
-                result.successful_items += 1
-                successful_data.append({
-                    "index": i,
-                    "data": data,
-                    "timestamp": None  # Could add timestamp here
-                })
+                extracted_buf[succ] = ExtractedItem(i, data)  # Could add timestamp here
+                succ += 1
             else:
-                result.failed_items += 1
-                failed_data.append({
-                    "index": i,
-                    "error": error_msg or "Unknown error",
-                    "partial_data": data if data else None
-                })
+                failed_buf[fi] = FailedItem(i, error_msg or "Unknown error", data if data else None)
+                fi += 1
                 
                 if error_msg:
                     warnings.append(f"Item {i}: {error_msg}")
+                
+                # Apply strategy to any partial data
+                item = handle_failed_data(i, data) if data else None
+                if item is not None:
+                    partial_items.append(item)
+                else:
+                    fail += 1
+        
+        # Complete items first, then partial items, each in index order
+        complete = succ
+        succ += len(partial_items)
+        extracted_buf[complete:succ] = partial_items
+        result.extracted_data = extracted_buf[:succ]
+        result.failed_extractions = failed_buf[:fi]
         
         # Calculate final statistics
-        result.extracted_data = successful_data
-        result.failed_extractions = failed_data
-        result.warnings = warnings
-        
-        # Apply strategy
-        if self.strategy == ExtractionStrategy.SKIP_FAILED:
-            # Keep only successful extractions
-            pass
-        elif self.strategy == ExtractionStrategy.PARTIAL_CONTENT:
-            # Try to include partial data from failed extractions
-            for failed_item in failed_data:
-                if failed_item.get("partial_data"):
-                    result.extracted_data.append({
-                        "index": failed_item["index"],
-                        "data": failed_item["partial_data"],
-                        "partial": True
-                    })
-                    result.successful_items += 1
-                    result.failed_items -= 1
-        
-        # Recalculate final statistics
-        result.__post_init__()
+        result.total_items = succ + fail
+        result.successful_items = succ
+        result.failed_items = fail
+        if result.total_items > 0:
+            result.success_rate, result.quality_score = _compute_stats(succ, result.total_items)
         
         # Check if result meets minimum requirements
-        if result.success_rate < self.min_success_rate:
-            warnings.append(f"Success rate {result.success_rate:.1%} below threshold {self.min_success_rate:.1%}")
-        
-        if result.quality_score < self.quality_threshold:
-            warnings.append(f"Quality score {result.quality_score:.1%} below threshold {self.quality_threshold:.1%}")
+        if result.success_rate < self._min_success_rate:
+            warnings.append("Success rate %.1f%% below threshold %s"
+                            % (result.success_rate * 100, self._success_threshold_str))
         
-        result.warnings = warnings
+        if result.quality_score < self._quality_threshold:
+            warnings.append("Quality score %.1f%% below threshold %s"
+                            % (result.quality_score * 100, self._quality_threshold_str))
         
-        logger.info(f"Partial extraction completed: {result.successful_items}/{result.total_items} items "
-                   f"({result.success_rate:.1%} success rate, {result.quality_score:.1%} quality score)")
+        # %-style arguments so formatting is skipped when INFO is disabled
+        logger.info("Partial extraction completed: %d/%d items (%.1f%% success rate, %.1f%% quality score)",
+                    result.successful_items, result.total_items,
+                    result.success_rate * 100, result.quality_score * 100)
         
         return result
     
@@ -176,7 +333,35 @@ class PartialExtractionHandler:
         return (result.success_rate >= self.min_success_rate and
                 result.quality_score >= self.quality_threshold)
     
-    def get_recovery_suggestions(self, result: PartialExtractionResult) -> List[str]:
+    def are_acceptable_results(self, results: Sequence[PartialExtractionResult]) -> List[bool]:
+        """
+        Check many partial extraction results at once.
+        
+        Rates and quality scores are recomputed from the item counts in one
+        aggregate_stats batch, so the check stays correct if the counts were
+        updated after the result was built.
+        
+        Args:
+            results: Partial extraction results to check
+            
+        Returns:
+            Per-result acceptability, in input order
+        """
+        rates, qualities = aggregate_stats(
+            [result.successful_items for result in results],
+            [result.total_items for result in results]
+        )
+        min_success_rate = self._min_success_rate
+        quality_threshold = self._quality_threshold
+        acceptable = []
+        for result, rate, quality in zip(results, rates, qualities):
+            # Empty results keep their stored stats, as in __post_init__
+            if not result.total_items:
+                rate, quality = result.success_rate, result.quality_score
+            acceptable.append(rate >= min_success_rate and quality >= quality_threshold)
+        return acceptable
+    
+    def get_recovery_suggestions(self, result: PartialExtractionResult) -> Sequence[str]:
         """
         Get suggestions for improving extraction results.
         
@@ -184,22 +369,29 @@ class PartialExtractionHandler:
             result: Partial extraction result
             
         Returns:
-            List of recovery suggestions
+            Sequence of recovery suggestions (a shared empty tuple when there are none)
         """
+        success_rate = result.success_rate
+        low_quality = result.quality_score < 0.5
+        more_failures = result.failed_items > result.successful_items
+        
+        if success_rate >= 0.6 and not low_quality and not more_failures:
+            return _EMPTY_SUGGESTIONS
+        
         suggestions = []
         
-        if result.success_rate < 0.3:
+        if success_rate < 0.3:
             suggestions.append("Very low success rate - check if the page structure has changed")
             suggestions.append("Consider updating the extraction selectors")
-        elif result.success_rate < 0.6:
+        elif success_rate < 0.6:
             suggestions.append("Moderate success rate - some extraction patterns may need adjustment")
             suggestions.append("Review failed extractions for common patterns")
         
-        if result.quality_score < 0.5:
+        if low_quality:
             suggestions.append("Low quality score - extracted data may be incomplete")
             suggestions.append("Consider implementing fallback extraction methods")
         
-        if result.failed_items > result.successful_items:
+        if more_failures:
             suggestions.append("More failures than successes - major extraction issue likely")
             suggestions.append("Check network connectivity and page loading")
         
@@ -247,7 +439,10 @@ def create_strict_extraction_handler() -> PartialExtractionHandler:
 __all__ = [
     "PartialExtractionHandler",
     "PartialExtractionResult",
+    "ExtractedItem",
+    "FailedItem",
     "ExtractionStrategy",
+    "aggregate_stats",
     "create_extraction_handler",
     "create_lenient_extraction_handler",
     "create_strict_extraction_handler"
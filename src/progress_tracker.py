@@ -7,18 +7,24 @@ including real-time progress indicators, status updates, time estimates, and
 user feedback mechanisms.
 """
 
+import os
+import sys
 import time
 import threading
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Callable, Any, Union, Deque
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Callable, Any, Union, Deque, Tuple
+from dataclasses import dataclass, field, replace
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
 import json
 import logging
 from collections import deque
-import statistics
-import uuid
+import heapq
+import itertools
+import functools
+from array import array
 
 try:
     from tqdm import tqdm
@@ -27,6 +33,11 @@ except ImportError:
     tqdm = None
     TqdmType = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from .session_recovery import CheckpointType, SessionState
 except ImportError:
@@ -35,6 +46,33 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses for the hot-path records where supported (Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Short ids for status updates and callback registrations: a process-wide
+# counter XORed with a random salt, unique for 2**32 ids per process
+_SHORT_ID_SALT = int.from_bytes(os.urandom(4), "big")
+_short_id_counter = itertools.count()
+
+
+def _next_short_id() -> str:
+    """Return the next 8-hex-digit id."""
+    return format((next(_short_id_counter) ^ _SHORT_ID_SALT) & 0xFFFFFFFF, "08x")
+
+
+# Lock-free stats read attempts before a reader falls back to the stats lock
+_SNAPSHOT_RETRIES = 100
+
+# Seconds stop_tracking() waits for in-flight callbacks before giving up
+_CALLBACK_WAIT_TIMEOUT = 5.0
+
+# ProgressStats counter incremented for each increment_error_count() type
+_ERROR_COUNTER_FIELDS = {
+    "error": "error_count",
+    "warning": "warning_count",
+    "retry": "retry_count",
+}
+
 
 class ProgressPhase(Enum):
     """Progress phases for extraction process."""
@@ -50,6 +88,15 @@ class ProgressPhase(Enum):
     COMPLETION = "completion"
 
 
+# Display titles for phases ("content_extraction" -> "Content Extraction")
+_PHASE_TITLES: Dict[ProgressPhase, str] = {
+    phase: phase.value.replace('_', ' ').title() for phase in ProgressPhase
+}
+_PHASE_BAR_DESCRIPTIONS: Dict[ProgressPhase, str] = {
+    phase: f"Phase: {title}" for phase, title in _PHASE_TITLES.items()
+}
+
+
 class StatusCategory(Enum):
     """Categories for status updates."""
     INFO = "info"
@@ -72,10 +119,34 @@ class CallbackTrigger(Enum):
     ALL = "all"  # Receives all status updates
 
 
-@dataclass
+# Status update triggers where only the latest update matters, so bursts
+# held back by batch_status_updates() collapse to one per phase
+_COALESCED_TRIGGERS = frozenset({CallbackTrigger.PHASE_PROGRESS, CallbackTrigger.EXTRACTION_UPDATE})
+
+# One bit per enum member, for CallbackRegistration's filter masks
+_TRIGGER_BITS: Dict[CallbackTrigger, int] = {trigger: 1 << i for i, trigger in enumerate(CallbackTrigger)}
+_PHASE_BITS: Dict[ProgressPhase, int] = {phase: 1 << i for i, phase in enumerate(ProgressPhase)}
+_CATEGORY_BITS: Dict[StatusCategory, int] = {category: 1 << i for i, category in enumerate(StatusCategory)}
+
+
+# CallbackRegistration fields folded into its filter bitmasks
+_FILTER_FIELDS = frozenset(("triggers", "phases", "categories"))
+
+
+def _bitmask(bits: Dict[Any, int], members: List[Any], empty: int = 0) -> int:
+    """OR together the bits of members; an empty filter yields empty."""
+    if not members:
+        return empty
+    mask = 0
+    for member in members:
+        mask |= bits[member]
+    return mask
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class StatusUpdate:
     """Represents a status update with details."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=_next_short_id)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     phase: ProgressPhase = ProgressPhase.INITIALIZATION
     category: StatusCategory = StatusCategory.INFO
@@ -85,64 +156,103 @@ class StatusUpdate:
     progress_data: Optional['ProgressStats'] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CallbackRegistration:
-    """Registration for status update callbacks."""
+    """
+    Registration for status update callbacks.
+    
+    The triggers, phases and categories filters are stored as tuples and
+    folded into bitmasks; assigning a new filter rebuilds the masks, so
+    they cannot drift out of sync with the filters.
+    """
     callback: Callable[[StatusUpdate], None]
-    callback_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-    triggers: List[CallbackTrigger] = field(default_factory=list)
-    phases: List[ProgressPhase] = field(default_factory=list)
-    categories: List[StatusCategory] = field(default_factory=list)
+    callback_id: str = field(default_factory=_next_short_id)
+    triggers: Tuple[CallbackTrigger, ...] = field(default_factory=tuple)
+    phases: Tuple[ProgressPhase, ...] = field(default_factory=tuple)
+    categories: Tuple[StatusCategory, ...] = field(default_factory=tuple)
     frequency: float = 0.5  # minimum seconds between calls
-    last_called: float = field(default_factory=time.time)
+    last_called: float = field(default_factory=time.monotonic)  # time.monotonic() of the last call
     active: bool = True
     
-    def should_trigger(self, status_update: StatusUpdate) -> bool:
-        """Check if this callback should be triggered for the given status update."""
+    # Filter bitmasks, set up by compile_filters()
+    _trigger_mask: int = field(init=False, repr=False, compare=False)
+    _phase_mask: int = field(init=False, repr=False, compare=False)
+    _category_mask: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Fold the filters into bitmasks."""
+        self.compile_filters()
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Store filters as tuples and keep the bitmasks in sync with them."""
+        if name in _FILTER_FIELDS:
+            value = tuple(value)
+            object.__setattr__(self, name, value)
+            # Masks are first built in __post_init__, once every filter is set
+            if hasattr(self, '_category_mask'):
+                self.compile_filters()
+            return
+        object.__setattr__(self, name, value)
+    
+    def compile_filters(self) -> None:
+        """Rebuild the filter bitmasks from triggers, phases and categories."""
+        if CallbackTrigger.ALL in self.triggers:
+            self._trigger_mask = -1
+        else:
+            self._trigger_mask = _bitmask(_TRIGGER_BITS, self.triggers)
+        # Empty phase/category filters match everything
+        self._phase_mask = _bitmask(_PHASE_BITS, self.phases, empty=-1)
+        self._category_mask = _bitmask(_CATEGORY_BITS, self.categories, empty=-1)
+    
+    def should_trigger(self, status_update: StatusUpdate, now: Optional[float] = None) -> bool:
+        """
+        Check if this callback should be triggered for the given status update.
+        
+        Args:
+            status_update: Status update being broadcast
+            now: time.monotonic() reading shared by a broadcast (default: read the clock)
+        """
         if not self.active:
             return False
         
         # Check frequency throttling
-        if (time.time() - self.last_called) < self.frequency:
+        if now is None:
+            now = time.monotonic()
+        if (now - self.last_called) < self.frequency:
             return False
         
-        # Check if any trigger matches
-        if CallbackTrigger.ALL in self.triggers or status_update.trigger in self.triggers:
-            trigger_match = True
-        else:
-            trigger_match = False
-        
-        # Check if phase matches (if specified)
-        if self.phases and status_update.phase not in self.phases:
-            phase_match = False
-        else:
-            phase_match = True
-        
-        # Check if category matches (if specified)
-        if self.categories and status_update.category not in self.categories:
-            category_match = False
-        else:
-            category_match = True
-        
-        return trigger_match and phase_match and category_match
+        return self.matches(status_update)
+    
+    def matches(self, status_update: StatusUpdate) -> bool:
+        """Check the status update against the filters, ignoring throttling."""
+        # Trigger, phase and category must each match their filter
+        return bool(
+            self._trigger_mask & _TRIGGER_BITS[status_update.trigger]
+            and self._phase_mask & _PHASE_BITS[status_update.phase]
+            and self._category_mask & _CATEGORY_BITS[status_update.category]
+        )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PhaseTimingMetrics:
     """Timing metrics for individual phases."""
     phase: ProgressPhase
-    start_time: datetime
+    start_time: datetime  # wall clock, for reporting only
     end_time: Optional[datetime] = None
     duration: Optional[timedelta] = None
     items_processed: int = 0
     processing_rate: float = 0.0  # items per second
+    start_ns: int = field(default_factory=time.monotonic_ns)
+    end_ns: Optional[int] = None
     
     def complete(self) -> None:
         """Mark phase as completed and calculate final metrics."""
-        if self.end_time is None:
-            self.end_time = datetime.now(timezone.utc)
+        if self.end_ns is None:
+            self.end_ns = time.monotonic_ns()
         
-        self.duration = self.end_time - self.start_time
+        self.duration = timedelta(microseconds=(self.end_ns - self.start_ns) // 1000)
+        if self.end_time is None:
+            self.end_time = self.start_time + self.duration
         
         # Ensure minimum duration for rate calculation
         duration_seconds = max(self.duration.total_seconds(), 0.001)
@@ -151,76 +261,141 @@ class PhaseTimingMetrics:
             self.processing_rate = self.items_processed / duration_seconds
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RateCalculator:
     """Advanced rate calculation with moving averages."""
     window_size: int = 10
-    measurements: Deque[float] = field(default_factory=lambda: deque(maxlen=10))
-    timestamps: Deque[datetime] = field(default_factory=lambda: deque(maxlen=10))
+    smoothing_alpha: Optional[float] = None  # EWMA weight of the newest interval; default 2 / (window_size + 1)
+    
+    # Internal state, set up in __post_init__ (declared so slotted classes have room)
+    _values: array = field(init=False, repr=False, compare=False)
+    _stamps: array = field(init=False, repr=False, compare=False)
+    _head: int = field(init=False, repr=False, compare=False)
+    _count: int = field(init=False, repr=False, compare=False)
+    _rates: Deque[Optional[float]] = field(init=False, repr=False, compare=False)
+    _rate_sum: float = field(init=False, repr=False, compare=False)
+    _rate_count: int = field(init=False, repr=False, compare=False)
+    _ema: float = field(init=False, repr=False, compare=False)
+    _ema_initialized: bool = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Initialize deques with correct maxlen."""
-        self.measurements = deque(maxlen=self.window_size)
-        self.timestamps = deque(maxlen=self.window_size)
+        """Allocate the fixed-capacity sample ring buffer."""
+        if self.smoothing_alpha is None:
+            # Standard EMA span matching the averaging window
+            self.smoothing_alpha = 2.0 / (max(self.window_size, 1) + 1)
+        
+        # Samples are stored unboxed in two parallel arrays (values and
+        # time.monotonic_ns() stamps); _head is the next write position
+        capacity = max(self.window_size, 1)
+        self._values = array('d', bytes(8 * capacity))
+        self._stamps = array('q', bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+        
+        # Per-interval rates between consecutive samples (None when the
+        # interval is empty), kept with a running sum so the average is O(1)
+        self._rates = deque(maxlen=max(self.window_size - 1, 0))
+        self._rate_sum = 0.0
+        self._rate_count = 0
+        
+        # Exponentially weighted moving average of the interval rates
+        self._ema = 0.0
+        self._ema_initialized = False
     
-    def add_measurement(self, value: float, timestamp: Optional[datetime] = None) -> None:
+    def add_measurement(self, value: float, timestamp_ns: Optional[int] = None) -> None:
         """Add a measurement for rate calculation."""
-        if timestamp is None:
-            timestamp = datetime.now(timezone.utc)
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        
+        capacity = len(self._values)
+        head = self._head
         
-        self.measurements.append(value)
-        self.timestamps.append(timestamp)
+        if self._count:
+            last = head - 1  # -1 wraps to the end of the buffer
+            time_diff = (timestamp_ns - self._stamps[last]) * 1e-9
+            rate = (value - self._values[last]) / time_diff if time_diff > 0 else None
+            
+            if rate is not None:
+                if self._ema_initialized:
+                    alpha = self.smoothing_alpha
+                    self._ema = alpha * rate + (1 - alpha) * self._ema
+                else:
+                    self._ema = rate
+                    self._ema_initialized = True
+            
+            if self._rates.maxlen:
+                # Drop the contribution of the interval about to be evicted
+                if len(self._rates) == self._rates.maxlen:
+                    evicted = self._rates[0]
+                    if evicted is not None:
+                        self._rate_sum -= evicted
+                        self._rate_count -= 1
+                
+                self._rates.append(rate)
+                if rate is not None:
+                    self._rate_sum += rate
+                    self._rate_count += 1
+        
+        self._values[head] = value
+        self._stamps[head] = timestamp_ns
+        # Wrap with a compare instead of a modulo (the window size is kept
+        # exact rather than rounded up to a power of two for masking)
+        head += 1
+        self._head = head if head < capacity else 0
+        if self._count < capacity:
+            self._count += 1
+    
+    def _ordered(self, buffer: array) -> List:
+        """Return the buffered samples oldest first."""
+        start = (self._head - self._count) % len(buffer)
+        return [buffer[(start + i) % len(buffer)] for i in range(self._count)]
+    
+    @property
+    def measurements(self) -> List[float]:
+        """Buffered measurement values, oldest first."""
+        return self._ordered(self._values)
+    
+    @property
+    def timestamps(self) -> List[int]:
+        """Buffered time.monotonic_ns() timestamps, oldest first."""
+        return self._ordered(self._stamps)
     
     def get_current_rate(self) -> float:
         """Calculate current rate (items per second)."""
-        if len(self.measurements) < 2:
+        if self._count < 2:
             return 0.0
         
         # Calculate rate over time window
-        time_span = (self.timestamps[-1] - self.timestamps[0]).total_seconds()
+        first = (self._head - self._count) % len(self._values)
+        last = self._head - 1
+        time_span = (self._stamps[last] - self._stamps[first]) * 1e-9
         if time_span <= 0:
             return 0.0
         
-        value_span = self.measurements[-1] - self.measurements[0]
+        value_span = self._values[last] - self._values[first]
         return value_span / time_span
     
     def get_average_rate(self) -> float:
         """Calculate average rate using moving window."""
-        if len(self.measurements) < 2:
+        if not self._rate_count:
             return 0.0
         
-        rates = []
-        for i in range(1, len(self.measurements)):
-            time_diff = (self.timestamps[i] - self.timestamps[i-1]).total_seconds()
-            if time_diff > 0:
-                value_diff = self.measurements[i] - self.measurements[i-1]
-                rates.append(value_diff / time_diff)
-        
-        return statistics.mean(rates) if rates else 0.0
+        return self._rate_sum / self._rate_count
     
-    def get_smoothed_rate(self, alpha: float = 0.3) -> float:
-        """Calculate exponentially smoothed rate."""
-        if len(self.measurements) < 2:
-            return 0.0
-        
-        current_rate = self.get_current_rate()
-        
-        # Initialize smoothed rate on first call
-        if not hasattr(self, '_last_smoothed_rate') or self._last_smoothed_rate is None:
-            self._last_smoothed_rate = current_rate
-        else:
-            # Apply exponential smoothing
-            self._last_smoothed_rate = alpha * current_rate + (1 - alpha) * self._last_smoothed_rate
-        
-        return self._last_smoothed_rate
+    def get_smoothed_rate(self) -> float:
+        """Get the exponentially smoothed rate (updated on each measurement)."""
+        return self._ema
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProgressStats:
     """Statistics for progress tracking."""
-    start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))  # wall clock, for reporting
     current_phase: ProgressPhase = ProgressPhase.INITIALIZATION
-    phase_start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    
+    # Monotonic timestamps (time.monotonic_ns()) used for all elapsed-time math
+    start_ns: int = field(default_factory=time.monotonic_ns)
+    phase_start_ns: int = field(default_factory=time.monotonic_ns)
     
     # Overall progress
     total_phases: int = 10
@@ -267,26 +442,71 @@ class ProgressStats:
     retry_count: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
+class ProgressSnapshot:
+    """Lightweight progress view used to redraw progress bars."""
+    current_phase: ProgressPhase
+    overall_percentage: float
+    phase_percentage: float
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ProgressCallback:
     """Callback configuration for progress updates."""
     callback: Callable[[ProgressStats], None]
     frequency: float = 1.0  # seconds between calls
-    last_called: float = field(default_factory=time.time)
+    next_call_ns: int = 0  # time.monotonic_ns() deadline for the next call
     
-    def should_call(self) -> bool:
-        """Check if callback should be called based on frequency."""
-        return (time.time() - self.last_called) >= self.frequency
+    def should_call(self, now_ns: Optional[int] = None) -> bool:
+        """
+        Check if callback should be called based on frequency.
+        
+        Args:
+            now_ns: time.monotonic_ns() reading shared by a dispatch (default: read the clock)
+        """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return now_ns >= self.next_call_ns
     
     def call(self, stats: ProgressStats) -> None:
         """Call the callback and update last called time."""
         try:
             self.callback(stats)
-            self.last_called = time.time()
+            self.next_call_ns = time.monotonic_ns() + int(self.frequency * 1e9)
         except Exception as e:
             logger.warning(f"Progress callback failed: {e}")
 
 
+# Marks the callback worker thread so it never waits on its own queue
+_callback_thread = threading.local()
+
+
+def _mark_callback_thread() -> None:
+    """Executor initializer flagging the current thread as the callback worker."""
+    _callback_thread.active = True
+
+
+@functools.lru_cache(maxsize=None)
+def _callback_executor() -> ThreadPoolExecutor:
+    """Single worker thread shared by all trackers for progress callbacks."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="progress-callbacks",
+                              initializer=_mark_callback_thread)
+
+
+def _wait_for_callbacks(future: Optional[Future]) -> None:
+    """
+    Wait (bounded) for a callback future to finish.
+    
+    Called from the callback worker itself (e.g. a callback that stops the
+    tracker) this returns immediately, since waiting there would deadlock.
+    """
+    if future is None or getattr(_callback_thread, 'active', False):
+        return
+    done, _ = wait([future], timeout=_CALLBACK_WAIT_TIMEOUT)
+    if not done:
+        logger.warning(f"Progress callbacks still running after {_CALLBACK_WAIT_TIMEOUT}s")
+
+
 class ProgressTracker:
     """
     Comprehensive progress tracking system for LinkedIn post extraction.
@@ -302,7 +522,8 @@ class ProgressTracker:
                  update_interval: float = 0.5,
                  save_stats: bool = True,
                  stats_file: Optional[str] = None,
-                 rate_window_size: int = 10):
+                 rate_window_size: int = 10,
+                 phase_history_size: Optional[int] = None):
         """
         Initialize progress tracker.
         
@@ -313,6 +534,8 @@ class ProgressTracker:
             save_stats: Save progress stats to file
             stats_file: Custom stats file path
             rate_window_size: Window size for rate calculations
+            phase_history_size: Completed phases kept in phase_history
+                (default: four passes over every phase)
         """
         self.enable_tqdm = enable_tqdm and tqdm is not None
         self.enable_logging = enable_logging
@@ -322,25 +545,52 @@ class ProgressTracker:
         
         # Progress state
         self.stats = ProgressStats()
-        self.callbacks: List[ProgressCallback] = []
+        # Progress callbacks ordered by next_call_ns; the sequence number
+        # breaks ties so callbacks themselves are never compared
+        self._callback_heap: List[Tuple[int, int, ProgressCallback]] = []
+        # Callbacks taken off the heap while a dispatch is calling them
+        self._due_callbacks: List[ProgressCallback] = []
+        self._callback_seq = itertools.count()
         self.phase_weights = self._get_phase_weights()
         
+        # Phase order, index and cumulative weights, computed once
+        self._phases = tuple(ProgressPhase)
+        self._phase_index = {phase: i for i, phase in enumerate(self._phases)}
+        self._phase_weight_list = tuple(self.phase_weights.get(phase, 0.0) for phase in self._phases)
+        # _weight_prefix[i] is the total weight of the first i phases
+        self._weight_prefix = tuple(itertools.accumulate(self._phase_weight_list, initial=0.0))
+        
         # Enhanced timing and rate tracking
         self.phase_timings: Dict[ProgressPhase, PhaseTimingMetrics] = {}
+        self._current_timing: Optional[PhaseTimingMetrics] = None  # timing of the running phase
         self.posts_rate_calculator = RateCalculator(window_size=rate_window_size)
         self.bytes_rate_calculator = RateCalculator(window_size=rate_window_size)
         self.overall_rate_calculator = RateCalculator(window_size=rate_window_size)
         
         # Phase history for better estimates
-        self.phase_history: List[PhaseTimingMetrics] = []
+        # Bounded: only recent phases feed the duration/rate estimates
+        if phase_history_size is None:
+            phase_history_size = len(ProgressPhase) * 4
+        self.phase_history: Deque[PhaseTimingMetrics] = deque(maxlen=phase_history_size)
+        
+        # Running aggregates over phase_history, updated in complete_phase
+        self._history_rate_sum = 0.0
+        self._history_rate_count = 0
+        self._history_duration_sum_s = 0.0
+        self._history_duration_count = 0
         self.last_posts_count = 0
         self.last_bytes_count = 0
         self.last_update_time = datetime.now(timezone.utc)
         
         # Enhanced status update and callback system
         self.callback_registrations: Dict[str, CallbackRegistration] = {}
-        self.status_history: List[StatusUpdate] = []
-        self.status_history_max_size = 100
+        self.status_history: Deque[StatusUpdate] = deque(maxlen=100)
+        
+        # Status updates held back while batching (see batch_status_updates);
+        # progress-type updates are coalesced to the latest per (trigger, phase)
+        self._batch_depth = 0
+        self._pending_updates: List[StatusUpdate] = []
+        self._pending_update_index: Dict[Tuple[CallbackTrigger, ProgressPhase], int] = {}
         self.milestones: Dict[str, bool] = {
             "first_post_extracted": False,
             "halfway_complete": False,
@@ -351,11 +601,34 @@ class ProgressTracker:
         # Progress bars
         self.overall_pbar: Optional[Any] = None
         self.phase_pbar: Optional[Any] = None
-        
-        # Threading
-        self._update_thread: Optional[threading.Thread] = None
-        self._stop_updates = threading.Event()
+        self._pending_phase_desc: Optional[str] = None
+        # Last integer percentage drawn per bar; -1 forces the next redraw
+        self._last_overall_n = -1
+        self._last_phase_n = -1
+        
+        # Threading; progress bars and callbacks are flushed by the updating
+        # thread itself at most once per update_interval. Every stats
+        # mutation holds the lock; readers copy without it (see
+        # _snapshot_stats) and only fall back to it under contention.
         self._stats_lock = threading.Lock()
+        self._last_flush_ns = 0
+        
+        # Progress callbacks run on the shared worker thread so a slow callback
+        # never blocks the updating thread; at most one dispatch is in flight
+        self._callback_future: Optional[Future] = None
+        # Most recently queued status update callback; the worker runs jobs
+        # in order, so waiting on it drains every earlier one
+        self._status_future: Optional[Future] = None
+        
+        # Stats generation: bumped by _mutating_stats() before and after
+        # every mutation, so it is odd while one is in progress. Readers copy
+        # the stats lock-free and retry if it changed (see _snapshot_stats);
+        # it also keys the summary report cache.
+        self._stats_version = 0
+        # (stats version, report) swapped as one tuple so readers never
+        # pair a report with the wrong version
+        self._summary_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._cached_completion_iso: Optional[Tuple[datetime, str]] = None
         
         # Session integration
         self.session_id: Optional[str] = None
@@ -386,14 +659,17 @@ class ProgressTracker:
             session_id: Session ID for integration with recovery system
             recovery_mode: Whether this is a recovery session
         """
-        with self._stats_lock:
+        with self._mutating_stats():
             self.session_id = session_id
             self.recovery_mode = recovery_mode
             
             if not recovery_mode:
                 self.stats = ProgressStats()
+                self._current_timing = None
             
             if self.enable_tqdm and tqdm:
+                self._last_overall_n = -1
+                self._last_phase_n = -1
                 self.overall_pbar = tqdm(
                     total=100,
                     desc="Overall Progress",
@@ -401,7 +677,7 @@ class ProgressTracker:
                     position=0,
                     leave=True
                 )
-                
+            
                 self.phase_pbar = tqdm(
                     total=100,
                     desc=f"Phase: {self.stats.current_phase.value}",
@@ -410,21 +686,15 @@ class ProgressTracker:
                     leave=False
                 )
         
-        # Start update thread
-        if not self._update_thread or not self._update_thread.is_alive():
-            self._stop_updates.clear()
-            self._update_thread = threading.Thread(target=self._update_loop, daemon=True)
-            self._update_thread.start()
-        
         if self.enable_logging:
             logger.info(f"Progress tracking started (session: {session_id}, recovery: {recovery_mode})")
     
     def stop_tracking(self) -> None:
         """Stop progress tracking and cleanup resources."""
-        self._stop_updates.set()
-        
-        if self._update_thread and self._update_thread.is_alive():
-            self._update_thread.join(timeout=2.0)
+        # Final flush so bars and callbacks see the last state, then let
+        # queued status update callbacks finish
+        self._flush(final=True)
+        _wait_for_callbacks(self._status_future)
         
         if self.overall_pbar:
             self.overall_pbar.close()
@@ -451,44 +721,51 @@ class ProgressTracker:
             total_items: Total items in this phase (for phase progress)
             description: Custom description for the phase
         """
-        with self._stats_lock:
+        completed = None
+        with self._mutating_stats():
             # Complete previous phase timing
             if self.stats.current_phase != phase:
                 self._complete_current_phase()
-                
+            
                 # Complete previous phase timing (but don't duplicate in history)
-                if self.stats.current_phase in self.phase_timings:
-                    prev_timing = self.phase_timings[self.stats.current_phase]
+                prev_timing = self._current_timing
+                if prev_timing is not None:
                     prev_timing.items_processed = self.stats.phase_items_completed
                     if prev_timing.end_time is None:  # Only complete if not already completed
                         prev_timing.complete()
-                        # Notify phase completion
-                        self.notify_phase_complete(self.stats.current_phase, prev_timing.duration)
+                        completed = (self.stats.current_phase, prev_timing.duration)
             
             # Start new phase
             self.stats.current_phase = phase
-            self.stats.phase_start_time = datetime.now(timezone.utc)
+            now_ns = time.monotonic_ns()
+            self.stats.phase_start_ns = now_ns
             self.stats.phase_percentage = 0.0
             self.stats.phase_items_total = total_items
             self.stats.phase_items_completed = 0
             
             # Initialize phase timing
-            self.phase_timings[phase] = PhaseTimingMetrics(
+            self._current_timing = self.phase_timings[phase] = PhaseTimingMetrics(
                 phase=phase,
-                start_time=self.stats.phase_start_time
+                start_time=self._wall_time(now_ns),
+                start_ns=self.stats.phase_start_ns
             )
             
             # Update overall progress and rates
             self._update_overall_progress()
-            self._update_advanced_rates()
+            self._update_advanced_rates(now_ns)
             
-            # Update progress bars
+            # Queue the bar change for the flush below
             if self.phase_pbar:
-                desc = description or f"Phase: {phase.value.replace('_', ' ').title()}"
-                self.phase_pbar.set_description(desc)
-                self.phase_pbar.reset()
+                self._pending_phase_desc = description or _PHASE_BAR_DESCRIPTIONS[phase]
+            self._last_flush_ns = now_ns
         
-        # Notify phase start
+        # Phase transitions bypass the update throttle so the bars never
+        # show a stale phase
+        self._flush()
+        
+        # Notify phase completion and start (outside the lock)
+        if completed is not None:
+            self.notify_phase_complete(*completed)
         self.notify_phase_start(phase, description)
         
         if self.enable_logging:
@@ -506,7 +783,8 @@ class ProgressTracker:
             percentage: Direct percentage (0-100)
             increment: Number of items to increment by
         """
-        with self._stats_lock:
+        notify = None
+        with self._mutating_stats():
             old_percentage = self.stats.phase_percentage
             
             if items_completed is not None:
@@ -526,12 +804,19 @@ class ProgressTracker:
             
             # Notify progress if significant change
             if abs(self.stats.phase_percentage - old_percentage) >= 5:  # 5% threshold
-                self.notify_phase_progress(
+                notify = (
                     self.stats.current_phase,
                     self.stats.phase_percentage,
                     self.stats.phase_items_completed,
                     self.stats.phase_items_total
                 )
+            
+            flush = self._flush_due(time.monotonic_ns())
+        
+        if notify is not None:
+            self.notify_phase_progress(*notify)
+        if flush:
+            self._flush()
     
     def update_extraction_stats(self,
                               posts_extracted: Optional[int] = None,
@@ -549,8 +834,9 @@ class ProgressTracker:
             scroll_target: Target scroll position
             bytes_processed: Bytes of data processed
         """
-        with self._stats_lock:
-            current_time = datetime.now(timezone.utc)
+        notify = None
+        with self._mutating_stats():
+            current_ns = time.monotonic_ns()
             old_posts_count = self.stats.posts_extracted
             
             # Update basic stats
@@ -566,31 +852,35 @@ class ProgressTracker:
                 self.stats.bytes_processed = bytes_processed
             
             # Update rate calculators
-            self.posts_rate_calculator.add_measurement(self.stats.posts_extracted, current_time)
-            self.bytes_rate_calculator.add_measurement(self.stats.bytes_processed, current_time)
-            self.overall_rate_calculator.add_measurement(self.stats.overall_percentage, current_time)
+            self.posts_rate_calculator.add_measurement(self.stats.posts_extracted, current_ns)
+            self.bytes_rate_calculator.add_measurement(self.stats.bytes_processed, current_ns)
+            self.overall_rate_calculator.add_measurement(self.stats.overall_percentage, current_ns)
             
             # Update phase timing
-            if self.stats.current_phase in self.phase_timings:
-                timing = self.phase_timings[self.stats.current_phase]
+            timing = self._current_timing
+            if timing is not None:
                 timing.items_processed = self.stats.phase_items_completed
             
             # Update all rate calculations
-            self._update_advanced_rates()
+            self._update_advanced_rates(current_ns)
             
             # Update time estimates
-            self._update_enhanced_time_estimates()
-            
-            # Update timing for current phase
-            self._update_phase_timing()
+            self._update_enhanced_time_estimates(current_ns, (current_ns - self.stats.start_ns) * 1e-9)
             
             # Notify extraction update if posts count changed significantly
             if posts_extracted is not None and abs(posts_extracted - old_posts_count) >= 1:
-                self.notify_extraction_update(
+                notify = (
                     posts_extracted,
                     posts_estimate,
                     self.stats.extraction_rate
                 )
+            
+            flush = self._flush_due(current_ns)
+        
+        if notify is not None:
+            self.notify_extraction_update(*notify)
+        if flush:
+            self._flush()
     
     def increment_error_count(self, error_type: str = "error") -> None:
         """
@@ -599,13 +889,13 @@ class ProgressTracker:
         Args:
             error_type: Type of error ("error", "warning", "retry")
         """
-        with self._stats_lock:
-            if error_type == "error":
-                self.stats.error_count += 1
-            elif error_type == "warning":
-                self.stats.warning_count += 1
-            elif error_type == "retry":
-                self.stats.retry_count += 1
+        # Resolve the counter before locking; unknown types never take the lock
+        counter = _ERROR_COUNTER_FIELDS.get(error_type)
+        if counter is None:
+            return
+        
+        with self._mutating_stats():
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
 
     def complete_phase(self, phase: Optional[ProgressPhase] = None) -> None:
         """
@@ -614,7 +904,7 @@ class ProgressTracker:
         Args:
             phase: Phase to complete (current phase if None)
         """
-        with self._stats_lock:
+        with self._mutating_stats():
             if phase and phase != self.stats.current_phase:
                 logger.warning(f"Completing phase {phase.value} but current phase is {self.stats.current_phase.value}")
             
@@ -623,15 +913,21 @@ class ProgressTracker:
                 self.stats.phase_items_completed = self.stats.phase_items_total
             
             # Complete the current phase timing
-            if self.stats.current_phase in self.phase_timings:
-                timing = self.phase_timings[self.stats.current_phase]
+            timing = self._current_timing
+            if timing is not None:
                 timing.items_processed = self.stats.phase_items_completed
                 timing.complete()
                 # Add to history
-                self.phase_history.append(timing)
+                self._append_phase_history(timing)
+                self._current_timing = None
             
             self._complete_current_phase()
             self._update_overall_progress()
+            self._last_flush_ns = time.monotonic_ns()
+        
+        # Show the completed phase right away rather than on the next
+        # throttled update (there may be none after the last phase)
+        self._flush()
 
     def add_callback(self, 
                     callback: Callable[[ProgressStats], None],
@@ -643,34 +939,147 @@ class ProgressTracker:
             callback: Function to call with progress stats
             frequency: Minimum seconds between calls
         """
-        self.callbacks.append(ProgressCallback(callback, frequency))
+        progress_callback = ProgressCallback(callback, frequency)
+        with self._stats_lock:
+            heapq.heappush(self._callback_heap,
+                           (progress_callback.next_call_ns, next(self._callback_seq), progress_callback))
         logger.debug(f"Added progress callback with frequency {frequency}s")
 
+    @property
+    def status_history_max_size(self) -> int:
+        """Maximum number of status updates kept in status_history."""
+        return self.status_history.maxlen
+
+    @status_history_max_size.setter
+    def status_history_max_size(self, max_size: int) -> None:
+        # A deque's maxlen is fixed, so rebuild it keeping the newest updates
+        with self._stats_lock:
+            self.status_history = deque(self.status_history, maxlen=max_size)
+
+    @property
+    def callbacks(self) -> List[ProgressCallback]:
+        """Registered progress callbacks, read from the dispatch heap."""
+        with self._stats_lock:
+            return [entry[2] for entry in self._callback_heap] + self._due_callbacks
+
     def get_stats(self) -> ProgressStats:
-        """Get current progress statistics."""
+        """Get a consistent copy of the current progress statistics."""
+        return self._snapshot_stats()[1]
+
+    @contextmanager
+    def _mutating_stats(self):
+        """
+        Hold the stats lock for a mutation, bumping _stats_version around it.
+        
+        The version is odd for the duration of the block, so lock-free
+        readers (see _snapshot_stats) retry instead of seeing a torn copy.
+        """
         with self._stats_lock:
-            # Update elapsed time
-            self.stats.elapsed_time = self._get_elapsed_time()
-            
-            # Update phase timing
-            if self.stats.current_phase in self.phase_timings:
-                timing = self.phase_timings[self.stats.current_phase]
-                current_time = datetime.now(timezone.utc)
-                self.stats.phase_elapsed_time = current_time - timing.start_time
-            
-            return self.stats
+            self._stats_version += 1
+            try:
+                yield
+            finally:
+                self._stats_version += 1
+
+    def get_progress_snapshot(self) -> "ProgressSnapshot":
+        """Get the overall and phase percentages without refreshing timing stats."""
+        for _ in range(_SNAPSHOT_RETRIES):
+            version = self._stats_version
+            stats = self.stats
+            snapshot = ProgressSnapshot(
+                current_phase=stats.current_phase,
+                overall_percentage=stats.overall_percentage,
+                phase_percentage=stats.phase_percentage
+            )
+            if not version & 1 and self._stats_version == version:
+                return snapshot
+            time.sleep(0)  # a mutation is in progress; let it finish
+        
+        # Still racing writers; copy under the lock instead
+        with self._stats_lock:
+            stats = self.stats
+            return ProgressSnapshot(
+                current_phase=stats.current_phase,
+                overall_percentage=stats.overall_percentage,
+                phase_percentage=stats.phase_percentage
+            )
+
+    def _snapshot_stats(self) -> Tuple[int, ProgressStats]:
+        """
+        Copy the stats without taking the stats lock.
+        
+        The copy is retried until it was taken between two reads of the
+        same even _stats_version, falling back to a copy under the lock after
+        _SNAPSHOT_RETRIES attempts; elapsed times are filled in on the copy.
+        
+        Returns:
+            Tuple of (stats version, stats copy)
+        """
+        for _ in range(_SNAPSHOT_RETRIES):
+            version = self._stats_version
+            if not version & 1:
+                snapshot = replace(self.stats)
+                timing = self._current_timing
+                if self._stats_version == version:
+                    break
+            time.sleep(0)  # a mutation is in progress; let it finish
+        else:
+            with self._stats_lock:
+                version = self._stats_version
+                snapshot = replace(self.stats)
+                timing = self._current_timing
+        
+        now_ns = time.monotonic_ns()
+        snapshot.elapsed_time = timedelta(microseconds=(now_ns - snapshot.start_ns) // 1000)
+        if timing is not None:
+            snapshot.phase_elapsed_time = timedelta(microseconds=(now_ns - timing.start_ns) // 1000)
+        return version, snapshot
 
     def get_summary_report(self) -> Dict[str, Any]:
-        """Get a comprehensive progress summary report."""
-        stats = self.get_stats()
+        """
+        Get a comprehensive progress summary report.
         
+        The report is rebuilt only when the stats changed since the last
+        call. Each call returns fresh copies of the (flat) sections, so
+        callers may modify the report without touching the cache.
+        """
+        cache = self._summary_cache
+        if cache is not None and cache[0] == self._stats_version:
+            # Unchanged stats: no snapshot needed, only the elapsed time
+            cached = cache[1]
+            elapsed = timedelta(microseconds=(time.monotonic_ns() - self.stats.start_ns) // 1000)
+        else:
+            version, stats = self._snapshot_stats()
+            cached = self._build_summary_report(stats)
+            self._summary_cache = (version, cached)
+            elapsed = stats.elapsed_time
+        
+        # Copy every section; elapsed time changes on every call, so it is
+        # never cached
+        report = {name: dict(section) for name, section in cached.items()}
+        report["session_info"]["elapsed_time"] = str(elapsed)
+        return report
+
+    def _completion_iso(self, completion: Optional[datetime]) -> Optional[str]:
+        """ISO format an estimated completion time, reusing the last result if unchanged."""
+        if completion is None:
+            return None
+        cached = self._cached_completion_iso
+        if cached is not None and cached[0] == completion:
+            return cached[1]
+        iso = completion.isoformat()
+        self._cached_completion_iso = (completion, iso)
+        return iso
+
+    def _build_summary_report(self, stats: ProgressStats) -> Dict[str, Any]:
+        """Build the summary report sections from the given stats."""
         return {
             "session_info": {
                 "session_id": self.session_id,
                 "recovery_mode": self.recovery_mode,
                 "start_time": stats.start_time.isoformat(),
                 "elapsed_time": str(stats.elapsed_time),
-                "estimated_completion": stats.estimated_completion.isoformat() if stats.estimated_completion else None
+                "estimated_completion": self._completion_iso(stats.estimated_completion)
             },
             "progress": {
                 "overall_percentage": stats.overall_percentage,
@@ -682,9 +1091,9 @@ class ProgressTracker:
             "extraction": {
                 "posts_extracted": stats.posts_extracted,
                 "posts_estimate": stats.posts_estimate,
-                "extraction_rate": round(stats.extraction_rate, 2),
-                "extraction_rate_per_second": round(stats.extraction_rate_per_second, 3),
-                "smoothed_extraction_rate": round(stats.smoothed_extraction_rate, 2),
+                "extraction_rate": stats.extraction_rate,
+                "extraction_rate_per_second": stats.extraction_rate_per_second,
+                "smoothed_extraction_rate": stats.smoothed_extraction_rate,
                 "scroll_position": stats.scroll_position,
                 "scroll_target": stats.scroll_target
             },
@@ -697,15 +1106,15 @@ class ProgressTracker:
             },
             "time_estimates": {
                 "estimated_remaining": str(stats.estimated_remaining) if stats.estimated_remaining else None,
-                "estimated_completion": stats.estimated_completion.isoformat() if stats.estimated_completion else None,
+                "estimated_completion": self._completion_iso(stats.estimated_completion),
                 "estimated_remaining_conservative": str(stats.estimated_remaining_conservative) if stats.estimated_remaining_conservative else None,
                 "estimated_remaining_optimistic": str(stats.estimated_remaining_optimistic) if stats.estimated_remaining_optimistic else None,
                 "phase_estimated_remaining": str(stats.phase_estimated_remaining) if stats.phase_estimated_remaining else None,
                 "average_phase_duration": str(stats.average_phase_duration) if stats.average_phase_duration else None
             },
             "rate_metrics": {
-                "current_phase_rate": round(stats.current_phase_rate, 3),
-                "average_phase_rate": round(stats.average_phase_rate, 3)
+                "current_phase_rate": stats.current_phase_rate,
+                "average_phase_rate": stats.average_phase_rate
             }
         }
 
@@ -718,28 +1127,17 @@ class ProgressTracker:
         if not self.phase_weights:
             return
         
-        total_progress = 0.0
-        completed_weight = 0.0
-        
-        # Add weight for completed phases
-        for phase in ProgressPhase:
-            if phase == self.stats.current_phase:
-                # Add partial progress for current phase
-                phase_weight = self.phase_weights.get(phase, 0.0)
-                phase_contribution = (self.stats.phase_percentage / 100.0) * phase_weight
-                total_progress += phase_contribution
-                break
-            else:
-                # Add full weight for completed phases
-                phase_weight = self.phase_weights.get(phase, 0.0)
-                if self.stats.completed_phases > list(ProgressPhase).index(phase):
-                    completed_weight += phase_weight
+        # Full weight for completed phases before the current one
+        index = self._phase_index[self.stats.current_phase]
+        completed_weight = self._weight_prefix[min(index, self.stats.completed_phases)]
         
-        total_progress += completed_weight
-        self.stats.overall_percentage = min(100.0, total_progress)
+        # Partial progress for current phase
+        phase_contribution = (self.stats.phase_percentage / 100.0) * self._phase_weight_list[index]
+        
+        self.stats.overall_percentage = min(100.0, phase_contribution + completed_weight)
 
-    def _update_advanced_rates(self) -> None:
-        """Update advanced rate calculations."""
+    def _update_advanced_rates(self, now_ns: int) -> None:
+        """Update advanced rate calculations as of now_ns (time.monotonic_ns())."""
         # Update extraction rates
         current_rate_per_second = self.posts_rate_calculator.get_current_rate()
         self.stats.extraction_rate_per_second = current_rate_per_second
@@ -747,31 +1145,35 @@ class ProgressTracker:
         self.stats.smoothed_extraction_rate = self.posts_rate_calculator.get_smoothed_rate() * 60.0
         
         # Update current phase rate
-        if self.stats.current_phase in self.phase_timings:
-            timing = self.phase_timings[self.stats.current_phase]
-            elapsed = datetime.now(timezone.utc) - timing.start_time
-            if elapsed.total_seconds() > 0 and timing.items_processed > 0:
-                self.stats.current_phase_rate = timing.items_processed / elapsed.total_seconds()
+        timing = self._current_timing
+        if timing is not None:
+            elapsed_s = (now_ns - timing.start_ns) * 1e-9
+            if elapsed_s > 0 and timing.items_processed > 0:
+                self.stats.current_phase_rate = timing.items_processed / elapsed_s
         
         # Update average phase rate
         if self.phase_history:
-            total_rate = sum(timing.processing_rate for timing in self.phase_history if timing.processing_rate > 0)
-            count = len([timing for timing in self.phase_history if timing.processing_rate > 0])
-            self.stats.average_phase_rate = total_rate / count if count > 0 else 0.0
+            count = self._history_rate_count
+            self.stats.average_phase_rate = self._history_rate_sum / count if count > 0 else 0.0
 
-    def _update_enhanced_time_estimates(self) -> None:
-        """Update enhanced time estimates with conservative and optimistic scenarios."""
+    def _update_enhanced_time_estimates(self, now_ns: int, elapsed_s: float) -> None:
+        """
+        Update enhanced time estimates with conservative and optimistic scenarios.
+        
+        Args:
+            now_ns: Current time.monotonic_ns() reading
+            elapsed_s: Seconds elapsed since tracking started
+        """
         if self.stats.overall_percentage > 0:
-            elapsed = self._get_elapsed_time()
-            if elapsed.total_seconds() > 0:
+            if elapsed_s > 0:
                 # Basic estimate using overall progress
-                basic_rate = self.stats.overall_percentage / elapsed.total_seconds()
+                basic_rate = self.stats.overall_percentage / elapsed_s
                 remaining_percentage = 100.0 - self.stats.overall_percentage
                 
                 if basic_rate > 0:
                     basic_remaining = remaining_percentage / basic_rate
                     self.stats.estimated_remaining = timedelta(seconds=basic_remaining)
-                    self.stats.estimated_completion = datetime.now(timezone.utc) + self.stats.estimated_remaining
+                    self.stats.estimated_completion = self.stats.start_time + timedelta(seconds=elapsed_s + basic_remaining)
                 
                 # Enhanced estimates using smoothed rates
                 if self.stats.smoothed_extraction_rate > 0 and self.stats.posts_estimate:
@@ -786,105 +1188,182 @@ class ProgressTracker:
                         self.stats.estimated_remaining_conservative = timedelta(minutes=conservative_minutes)
                 
                 # Phase-based estimates
-                self._update_phase_based_estimates()
+                self._update_phase_based_estimates(now_ns)
 
-    def _update_phase_based_estimates(self) -> None:
+    def _update_phase_based_estimates(self, now_ns: int) -> None:
         """Update estimates based on phase-specific historical data."""
         if not self.phase_history:
             return
         
-        # Calculate average phase duration
-        phase_durations = [timing.duration for timing in self.phase_history if timing.duration]
-        if phase_durations:
-            avg_duration = sum(phase_durations, timedelta()) / len(phase_durations)
-            self.stats.average_phase_duration = avg_duration
+        # Calculate average phase duration (float seconds; timedeltas are
+        # only built for the stored results)
+        avg_seconds = 0.0
+        if self._history_duration_count:
+            avg_seconds = self._history_duration_sum_s / self._history_duration_count
+            self.stats.average_phase_duration = timedelta(seconds=avg_seconds)
+        elif self.stats.average_phase_duration:
+            avg_seconds = self.stats.average_phase_duration.total_seconds()
         
         # Estimate remaining time based on remaining phases
-        remaining_phases = len(ProgressPhase) - self.stats.completed_phases - 1  # -1 for current phase
-        if remaining_phases > 0 and self.stats.average_phase_duration:
-            phase_estimate = self.stats.average_phase_duration * remaining_phases
+        remaining_phases = len(self._phases) - self.stats.completed_phases - 1  # -1 for current phase
+        if remaining_phases > 0 and avg_seconds:
+            phase_estimate_s = avg_seconds * remaining_phases
             
             # Add current phase estimate
             current_phase_progress = self.stats.phase_percentage / 100.0
-            if current_phase_progress > 0 and self.stats.current_phase in self.phase_timings:
-                current_timing = self.phase_timings[self.stats.current_phase]
-                current_elapsed = datetime.now(timezone.utc) - current_timing.start_time
-                if current_phase_progress > 0:
-                    estimated_current_total = current_elapsed / current_phase_progress
-                    current_phase_remaining = estimated_current_total - current_elapsed
-                    phase_estimate += current_phase_remaining
+            current_timing = self._current_timing
+            if current_phase_progress > 0 and current_timing is not None:
+                elapsed_s = (now_ns - current_timing.start_ns) * 1e-9
+                phase_estimate_s += elapsed_s / current_phase_progress - elapsed_s
             
-            self.stats.phase_estimated_remaining = phase_estimate
+            self.stats.phase_estimated_remaining = timedelta(seconds=phase_estimate_s)
+
+    def _append_phase_history(self, timing: PhaseTimingMetrics) -> None:
+        """Append a completed phase to phase_history, keeping the running aggregates in sync."""
+        history = self.phase_history
+        if history and len(history) == history.maxlen:
+            self._update_history_aggregates(history[0], -1)
+        history.append(timing)
+        self._update_history_aggregates(timing, 1)
 
-    def _update_phase_timing(self) -> None:
-        """Update timing for the current phase."""
-        if self.stats.current_phase in self.phase_timings:
-            timing = self.phase_timings[self.stats.current_phase]
-            timing.items_processed = self.stats.phase_items_completed
+    def _update_history_aggregates(self, timing: PhaseTimingMetrics, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a phase from the running aggregates."""
+        if timing.processing_rate > 0:
+            self._history_rate_sum += sign * timing.processing_rate
+            self._history_rate_count += sign
+        if timing.duration:
+            self._history_duration_sum_s += sign * timing.duration.total_seconds()
+            self._history_duration_count += sign
 
     def get_timing_summary(self) -> Dict[str, Any]:
         """Get a comprehensive summary of timing metrics."""
+        stats = self.get_stats()
         return {
             "overall_timing": {
-                "elapsed": str(self.stats.elapsed_time),
-                "estimated_remaining": str(self.stats.estimated_remaining) if self.stats.estimated_remaining else None,
-                "estimated_completion": self.stats.estimated_completion.isoformat() if self.stats.estimated_completion else None
+                "elapsed": str(stats.elapsed_time),
+                "estimated_remaining": str(stats.estimated_remaining) if stats.estimated_remaining else None,
+                "estimated_completion": self._completion_iso(stats.estimated_completion)
             },
             "enhanced_estimates": {
-                "conservative_remaining": str(self.stats.estimated_remaining_conservative) if self.stats.estimated_remaining_conservative else None,
-                "optimistic_remaining": str(self.stats.estimated_remaining_optimistic) if self.stats.estimated_remaining_optimistic else None
+                "conservative_remaining": str(stats.estimated_remaining_conservative) if stats.estimated_remaining_conservative else None,
+                "optimistic_remaining": str(stats.estimated_remaining_optimistic) if stats.estimated_remaining_optimistic else None
             },
             "phase_timing": {
-                "current_phase_elapsed": str(self.stats.phase_elapsed_time),
-                "phase_estimated_remaining": str(self.stats.phase_estimated_remaining) if self.stats.phase_estimated_remaining else None,
-                "average_phase_duration": str(self.stats.average_phase_duration) if self.stats.average_phase_duration else None
+                "current_phase_elapsed": str(stats.phase_elapsed_time),
+                "phase_estimated_remaining": str(stats.phase_estimated_remaining) if stats.phase_estimated_remaining else None,
+                "average_phase_duration": str(stats.average_phase_duration) if stats.average_phase_duration else None
             },
             "phase_history": [
                 {
                     "phase": timing.phase.value,
                     "duration": str(timing.duration) if timing.duration else None,
                     "items_processed": timing.items_processed,
-                    "processing_rate": round(timing.processing_rate, 3)
+                    "processing_rate": timing.processing_rate
                 }
                 for timing in self.phase_history
             ]
         }
 
-    def _get_elapsed_time(self) -> timedelta:
-        """Get elapsed time since tracking started."""
-        return datetime.now(timezone.utc) - self.stats.start_time
+    def _wall_time(self, now_ns: int) -> datetime:
+        """Convert a time.monotonic_ns() reading to wall-clock time for reporting."""
+        return self.stats.start_time + timedelta(microseconds=(now_ns - self.stats.start_ns) // 1000)
 
-    def _update_loop(self) -> None:
-        """Background update loop for progress indicators and callbacks."""
-        while not self._stop_updates.wait(self.update_interval):
-            try:
-                current_stats = self.get_stats()
-                
-                # Update progress bars
-                if self.overall_pbar:
-                    self.overall_pbar.n = int(current_stats.overall_percentage)
+    def _flush_due(self, now_ns: int) -> bool:
+        """Check (with the stats lock held) whether a flush is due and claim it."""
+        if now_ns - self._last_flush_ns < self.update_interval * 1e9:
+            return False
+        self._last_flush_ns = now_ns
+        return True
+
+    def _flush(self, final: bool = False) -> None:
+        """
+        Refresh progress indicators and dispatch due callbacks.
+        
+        Args:
+            final: Wait for in-flight callbacks and run due ones synchronously
+        """
+        try:
+            with self._stats_lock:
+                pending_desc = self._pending_phase_desc
+                self._pending_phase_desc = None
+            
+            # Bars only need the percentages; the full stats copy (with
+            # refreshed elapsed times) is made only for callbacks
+            progress = self.get_progress_snapshot()
+            has_callbacks = self._callback_heap or self._due_callbacks
+            snapshot = self._snapshot_stats()[1] if has_callbacks else None
+            
+            # Update progress bars, redrawing only when the integer
+            # percentage (or the phase description) changed
+            if self.overall_pbar:
+                overall_n = int(progress.overall_percentage)
+                if overall_n != self._last_overall_n:
+                    self._last_overall_n = overall_n
+                    self.overall_pbar.n = overall_n
                     self.overall_pbar.refresh()
-                
-                if self.phase_pbar:
-                    self.phase_pbar.n = int(current_stats.phase_percentage)
+            
+            if self.phase_pbar:
+                if pending_desc is not None:
+                    self.phase_pbar.reset()
+                    self.phase_pbar.set_description(pending_desc, refresh=False)
+                    self._last_phase_n = -1
+                phase_n = int(progress.phase_percentage)
+                if phase_n != self._last_phase_n:
+                    self._last_phase_n = phase_n
+                    self.phase_pbar.n = phase_n
                     self.phase_pbar.refresh()
-                
-                # Call callbacks
-                for callback in self.callbacks:
-                    if callback.should_call():
-                        callback.call(current_stats)
-                
-            except Exception as e:
-                logger.error(f"Error in progress update loop: {e}")
+            
+            # Call callbacks on a snapshot; skip this flush if the previous
+            # dispatch is still running, the next one carries fresher stats
+            if snapshot is not None:
+                future = self._callback_future
+                if final:
+                    _wait_for_callbacks(future)
+                    self._run_callbacks(snapshot)
+                elif future is None or future.done():
+                    self._callback_future = _callback_executor().submit(self._run_callbacks, snapshot)
+            
+        except Exception as e:
+            logger.error(f"Error in progress update flush: {e}")
+
+    def _run_callbacks(self, stats: ProgressStats) -> None:
+        """Call every due progress callback with the given stats snapshot."""
+        # One clock read; only callbacks at the top of the heap are due
+        now_ns = time.monotonic_ns()
+        heap = self._callback_heap
+        due = []
+        with self._stats_lock:
+            while heap and heap[0][2].should_call(now_ns):
+                due.append(heapq.heappop(heap)[2])
+            self._due_callbacks.extend(due)
+        
+        for callback in due:
+            callback.call(stats)
+        
+        # Reschedule after calling; a failed callback keeps its deadline
+        if due:
+            with self._stats_lock:
+                for callback in due:
+                    heapq.heappush(heap, (callback.next_call_ns, next(self._callback_seq), callback))
+                called = set(map(id, due))
+                self._due_callbacks = [c for c in self._due_callbacks if id(c) not in called]
 
     def _save_stats(self) -> None:
         """Save progress statistics to file."""
         try:
             self.stats_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.get_summary_report(), f, indent=2, default=str)
-                
+            report = self.get_summary_report()
+            if orjson is not None:
+                data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(report, indent=2).encode('utf-8')
+            
+            # Write a temporary file and rename it so readers never see a partial file
+            tmp_file = self.stats_file.with_name(self.stats_file.name + '.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.stats_file)
+            
             logger.debug(f"Progress stats saved to {self.stats_file}")
         except Exception as e:
             logger.error(f"Failed to save progress stats: {e}")
@@ -897,7 +1376,7 @@ class ProgressTracker:
             phase: Phase that is starting
             description: Optional description
         """
-        message = f"Started phase: {phase.value.replace('_', ' ').title()}"
+        message = f"Started phase: {_PHASE_TITLES[phase]}"
         if description:
             message += f" - {description}"
         
@@ -922,7 +1401,7 @@ class ProgressTracker:
             items_completed: Items completed in phase
             items_total: Total items in phase
         """
-        message = f"Phase {phase.value.replace('_', ' ').title()}: {progress:.1f}%"
+        message = f"Phase {_PHASE_TITLES[phase]}: {progress:.1f}%"
         if items_completed is not None and items_total is not None:
             message += f" ({items_completed}/{items_total} items)"
         
@@ -946,7 +1425,7 @@ class ProgressTracker:
             phase: Phase that completed
             duration: Phase duration
         """
-        message = f"Completed phase: {phase.value.replace('_', ' ').title()}"
+        message = f"Completed phase: {_PHASE_TITLES[phase]}"
         if duration:
             message += f" (took {duration})"
         
@@ -997,21 +1476,21 @@ class ProgressTracker:
             total_items: Total items in this phase (for phase progress)
             description: Custom description for the phase
         """
-        with self._stats_lock:
-            # Check if phase is already current
-            if self.stats.current_phase == phase:
-                logger.debug(f"Phase {phase.value} is already current")
-                return
-            
-            # Complete previous phase if needed
-            if self.stats.current_phase != ProgressPhase.COMPLETION:
-                self.complete_phase()
-            
-            # Start new phase
-            self.start_phase(phase, total_items, description)
-            
-            # Notify phase start
-            self.notify_phase_start(phase, description)
+        # complete_phase and start_phase take the stats lock themselves
+        # Check if phase is already current
+        if self.stats.current_phase == phase:
+            logger.debug(f"Phase {phase.value} is already current")
+            return
+        
+        # Complete previous phase if needed
+        if self.stats.current_phase != ProgressPhase.COMPLETION:
+            self.complete_phase()
+        
+        # Start new phase
+        self.start_phase(phase, total_items, description)
+        
+        # Notify phase start
+        self.notify_phase_start(phase, description)
 
     def broadcast_status_update(self, message: str, category: StatusCategory, trigger: CallbackTrigger, details: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -1033,68 +1512,145 @@ class ProgressTracker:
             details=details or {}
         )
         
-        # Add to status history
+        # Add to status history; while batching, hold the callbacks back
         with self._stats_lock:
             self.status_history.append(status_update)
-            if len(self.status_history) > self.status_history_max_size:
-                self.status_history.pop(0)
+            batched = self._batch_depth > 0
+            if batched:
+                self._queue_status_update(status_update)
         
         # Check milestones
         self.check_and_notify_milestones()
         
-        # Trigger matching callbacks
+        if not batched:
+            self._dispatch_status_update(status_update)
+
+    def _queue_status_update(self, status_update: StatusUpdate) -> None:
+        """Hold a status update until the batch ends (stats lock held)."""
+        if status_update.trigger in _COALESCED_TRIGGERS:
+            key = (status_update.trigger, status_update.phase)
+            index = self._pending_update_index.get(key)
+            if index is not None:
+                self._pending_updates[index] = status_update
+                return
+            self._pending_update_index[key] = len(self._pending_updates)
+        self._pending_updates.append(status_update)
+
+    def begin_batch(self) -> None:
+        """Start holding back status update callbacks until end_batch()."""
+        with self._stats_lock:
+            self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """End a batch; the outermost end_batch() dispatches the held updates."""
+        with self._stats_lock:
+            if self._batch_depth:
+                self._batch_depth -= 1
+            if self._batch_depth:
+                return
+            pending = self._pending_updates
+            self._pending_updates = []
+            self._pending_update_index = {}
+        
+        if pending:
+            self._dispatch_batch(pending)
+
+    @contextmanager
+    def batch_status_updates(self):
+        """
+        Batch status update callbacks for the duration of a with block.
+        
+        Updates are still recorded in status_history as they happen, but
+        callbacks receive them when the block exits, with bursts of phase
+        progress and extraction updates collapsed to the latest one. The
+        flushed batch bypasses each callback's frequency throttle, so every
+        matching held update is delivered.
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def _dispatch_status_update(self, status_update: StatusUpdate) -> None:
+        """Queue the callbacks matching a status update on the callback worker."""
+        # Queue matching callbacks on the shared worker thread; it runs them
+        # in submission order, so each callback sees its updates in order.
+        # One clock reading covers every registration's throttle check.
+        now = time.monotonic()
         for callback_id, registration in self.callback_registrations.items():
-            if registration.should_trigger(status_update):
-                try:
-                    registration.callback(status_update)
-                    registration.last_called = time.time()
-                    logger.debug(f"Triggered callback {callback_id}")
-                except Exception as e:
-                    logger.error(f"Error in callback {callback_id}: {e}")
+            if registration.should_trigger(status_update, now):
+                registration.last_called = now
+                self._status_future = _callback_executor().submit(
+                    self._run_status_callback, callback_id, registration, status_update
+                )
+
+    def _dispatch_batch(self, status_updates: List[StatusUpdate]) -> None:
+        """Queue a flushed batch, one job per registration with all its matching updates."""
+        # The batch counts as a single delivery for throttling: every
+        # matching update is passed on, and last_called is set once
+        now = time.monotonic()
+        for callback_id, registration in self.callback_registrations.items():
+            if not registration.active:
+                continue
+            matching = [update for update in status_updates if registration.matches(update)]
+            if matching:
+                registration.last_called = now
+                self._status_future = _callback_executor().submit(
+                    self._run_status_callbacks, callback_id, registration, matching
+                )
+
+    @staticmethod
+    def _run_status_callbacks(callback_id: str, registration: CallbackRegistration,
+                              status_updates: List[StatusUpdate]) -> None:
+        """Call one status update callback for each update of a flushed batch, in order."""
+        for status_update in status_updates:
+            ProgressTracker._run_status_callback(callback_id, registration, status_update)
+
+    @staticmethod
+    def _run_status_callback(callback_id: str, registration: CallbackRegistration,
+                             status_update: StatusUpdate) -> None:
+        """Call one status update callback, logging (not raising) its errors."""
+        try:
+            registration.callback(status_update)
+            logger.debug(f"Triggered callback {callback_id}")
+        except Exception as e:
+            logger.error(f"Error in callback {callback_id}: {e}")
 
     def check_and_notify_milestones(self) -> None:
         """Check and notify milestone achievements."""
+        # Claim milestones under the lock, broadcast them after releasing it
+        # (broadcast_status_update takes the lock itself)
+        reached = []
         with self._stats_lock:
             # Milestone: First post extracted
             if not self.milestones["first_post_extracted"] and self.stats.posts_extracted > 0:
                 self.milestones["first_post_extracted"] = True
-                self.broadcast_status_update(
-                    message="Milestone reached: First post extracted!",
-                    category=StatusCategory.MILESTONE,
-                    trigger=CallbackTrigger.MILESTONE_REACHED,
-                    details={"milestone": "first_post_extracted"}
-                )
+                reached.append(("first_post_extracted", "Milestone reached: First post extracted!"))
             
             # Milestone: Halfway complete
             if not self.milestones["halfway_complete"] and self.stats.completed_phases >= (self.stats.total_phases / 2):
                 self.milestones["halfway_complete"] = True
-                self.broadcast_status_update(
-                    message="Milestone reached: Halfway to completion!",
-                    category=StatusCategory.MILESTONE,
-                    trigger=CallbackTrigger.MILESTONE_REACHED,
-                    details={"milestone": "halfway_complete"}
-                )
+                reached.append(("halfway_complete", "Milestone reached: Halfway to completion!"))
             
             # Milestone: Scroll complete (if applicable)
             if not self.milestones["scroll_complete"] and self.stats.scroll_target is not None:
                 if self.stats.scroll_position >= self.stats.scroll_target:
                     self.milestones["scroll_complete"] = True
-                    self.broadcast_status_update(
-                        message="Milestone reached: Scroll complete!",
-                        category=StatusCategory.MILESTONE,
-                        trigger=CallbackTrigger.MILESTONE_REACHED,
-                        details={"milestone": "scroll_complete"}
-                    )
+                    reached.append(("scroll_complete", "Milestone reached: Scroll complete!"))
             
             # Milestone: Extraction complete
             if not self.milestones["extraction_complete"] and self.stats.completed_phases == self.stats.total_phases:
                 self.milestones["extraction_complete"] = True
-                self.broadcast_status_update(
-                    message="Milestone reached: Extraction complete!",
-                    category=StatusCategory.MILESTONE,
-                    trigger=CallbackTrigger.MILESTONE_REACHED,
-                    details={"milestone": "extraction_complete"}
-                )
+                reached.append(("extraction_complete", "Milestone reached: Extraction complete!"))
+        
+        for milestone, message in reached:
+            self.broadcast_status_update(
+                message=message,
+                category=StatusCategory.MILESTONE,
+                trigger=CallbackTrigger.MILESTONE_REACHED,
+                details={"milestone": milestone}
+            )
 
 # Convenience functions
 def create_progress_tracker(enable_tqdm: bool = True,
@@ -1130,44 +1686,50 @@ def create_console_callback() -> Callable[[ProgressStats], None]:
         elapsed = stats.elapsed_time
         remaining = stats.estimated_remaining
         
-        print(f"\n=== Progress Update ===")
-        print(f"Overall: {stats.overall_percentage:.1f}%")
-        print(f"Phase: {stats.current_phase.value} ({stats.phase_percentage:.1f}%)")
-        print(f"Posts: {stats.posts_extracted}")
+        # Build the whole block and write it once rather than print() per line
+        lines = [
+            "",
+            "=== Progress Update ===",
+            f"Overall: {stats.overall_percentage:.1f}%",
+            f"Phase: {stats.current_phase.value} ({stats.phase_percentage:.1f}%)",
+            f"Posts: {stats.posts_extracted}",
+        ]
         if stats.posts_estimate:
-            print(f"Estimated total: {stats.posts_estimate}")
-        print(f"Elapsed: {elapsed}")
+            lines.append(f"Estimated total: {stats.posts_estimate}")
+        lines.append(f"Elapsed: {elapsed}")
         
         # Enhanced time estimates
         if remaining:
-            print(f"Remaining: {remaining}")
+            lines.append(f"Remaining: {remaining}")
         if stats.estimated_remaining_conservative:
-            print(f"Conservative: {stats.estimated_remaining_conservative}")
+            lines.append(f"Conservative: {stats.estimated_remaining_conservative}")
         if stats.estimated_remaining_optimistic:
-            print(f"Optimistic: {stats.estimated_remaining_optimistic}")
+            lines.append(f"Optimistic: {stats.estimated_remaining_optimistic}")
         
         # Enhanced rate information
-        print(f"Rate: {stats.extraction_rate:.1f} posts/min")
+        lines.append(f"Rate: {stats.extraction_rate:.1f} posts/min")
         if stats.smoothed_extraction_rate > 0:
-            print(f"Smoothed rate: {stats.smoothed_extraction_rate:.1f} posts/min")
+            lines.append(f"Smoothed rate: {stats.smoothed_extraction_rate:.1f} posts/min")
         if stats.current_phase_rate > 0:
-            print(f"Current phase rate: {stats.current_phase_rate:.2f} items/sec")
+            lines.append(f"Current phase rate: {stats.current_phase_rate:.2f} items/sec")
         
         # Phase timing
         if stats.phase_elapsed_time.total_seconds() > 0:
-            print(f"Phase elapsed: {stats.phase_elapsed_time}")
+            lines.append(f"Phase elapsed: {stats.phase_elapsed_time}")
         if stats.average_phase_duration:
-            print(f"Avg phase duration: {stats.average_phase_duration}")
+            lines.append(f"Avg phase duration: {stats.average_phase_duration}")
         
         # Error information
         if stats.error_count > 0:
-            print(f"Errors: {stats.error_count}")
+            lines.append(f"Errors: {stats.error_count}")
         if stats.warning_count > 0:
-            print(f"Warnings: {stats.warning_count}")
+            lines.append(f"Warnings: {stats.warning_count}")
         if stats.retry_count > 0:
-            print(f"Retries: {stats.retry_count}")
+            lines.append(f"Retries: {stats.retry_count}")
         
-        print("=" * 23)
+        lines.append("=" * 23)
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
     
     return console_callback
 
@@ -1180,6 +1742,7 @@ __all__ = [
     "StatusUpdate",
     "CallbackRegistration",
     "ProgressStats", 
+    "ProgressSnapshot",
     "ProgressCallback",
     "ProgressTracker",
     "PhaseTimingMetrics",
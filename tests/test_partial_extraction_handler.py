@@ -0,0 +1,50 @@
+"""
+Tests for batch statistics in the partial extraction handler.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports, as main.py does
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+import partial_extraction_handler
+from partial_extraction_handler import (
+    ExtractionStrategy,
+    PartialExtractionHandler,
+    PartialExtractionResult,
+    aggregate_stats,
+)
+
+COUNTS = [(0, 0), (0, 5), (3, 7), (5, 5), (4, 5), (1, 3), (2, 9)]
+
+
+def _expected_stats():
+    results = [PartialExtractionResult(total_items=total, successful_items=successful)
+               for successful, total in COUNTS]
+    return [r.success_rate for r in results], [r.quality_score for r in results]
+
+
+def test_aggregate_stats_fallback_matches_per_result_stats(monkeypatch):
+    """The pure-Python path gives the same stats as PartialExtractionResult."""
+    monkeypatch.setattr(partial_extraction_handler, "_aggregate_stats_jit", None)
+    successful, total = zip(*COUNTS)
+    assert aggregate_stats(successful, total) == _expected_stats()
+
+
+def test_aggregate_stats_matches_per_result_stats():
+    """Whichever path is active (Numba or not) gives the per-result stats."""
+    successful, total = zip(*COUNTS)
+    assert aggregate_stats(successful, total) == _expected_stats()
+
+
+def test_are_acceptable_results_matches_is_acceptable_result():
+    """The batch check agrees with the single-result check."""
+    handler = PartialExtractionHandler(ExtractionStrategy.SKIP_FAILED,
+                                       min_success_rate=0.5, quality_threshold=0.6)
+    results = [PartialExtractionResult(total_items=total, successful_items=successful)
+               for successful, total in COUNTS]
+    assert handler.are_acceptable_results(results) == [
+        handler.is_acceptable_result(result) for result in results
+    ]
@@ -0,0 +1,47 @@
+"""
+Tests for status update batching in the progress tracker.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports, as main.py does
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from progress_tracker import (
+    CallbackRegistration,
+    CallbackTrigger,
+    ProgressPhase,
+    ProgressTracker,
+)
+
+
+def test_batched_phase_start_and_final_progress_reach_callback():
+    """A flushed batch is not dropped by the callback's frequency throttle."""
+    tracker = ProgressTracker(enable_tqdm=False, enable_logging=False, save_stats=False)
+    tracker.start_tracking("batch-test")
+    
+    received = []
+    tracker.callback_registrations["test"] = CallbackRegistration(
+        callback=received.append,
+        triggers=[CallbackTrigger.PHASE_START, CallbackTrigger.PHASE_PROGRESS],
+        frequency=0.5
+    )
+    
+    with tracker.batch_status_updates():
+        tracker.manage_phase(ProgressPhase.URL_VALIDATION, total_items=10)
+        tracker.manage_phase(ProgressPhase.BROWSER_STARTUP, total_items=4)
+        for completed in range(1, 5):
+            tracker.update_phase_progress(items_completed=completed)
+    
+    tracker.stop_tracking()
+    
+    started = [update.phase for update in received
+               if update.trigger == CallbackTrigger.PHASE_START]
+    assert ProgressPhase.URL_VALIDATION in started
+    assert ProgressPhase.BROWSER_STARTUP in started
+    
+    progress = [update for update in received
+                if update.trigger == CallbackTrigger.PHASE_PROGRESS]
+    assert progress[-1].details["items_completed"] == 4